@@ -0,0 +1,129 @@
+import gzip
+import io
+import timeit
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+from automations.models import Execution, Task
+from automations.serializers import ExecutionSummarySerializer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Command(BaseCommand):
+    help = "Compare the stdlib and orjson renderer/parser on ExecutionList-shaped responses."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100, help="Executions per page.")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, rows, iterations, **options):
+        payloads = {
+            "execution list page": self.execution_list_page(rows),
+            "execution detail": self.execution_detail(tasks=10),
+        }
+
+        for name, data in payloads.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name}"))
+            results = {}
+            for label, renderer, parser in (
+                ("json", JSONRenderer(), JSONParser()),
+                ("orjson", ORJSONRenderer(), ORJSONParser()),
+            ):
+                body = renderer.render(data)
+                render_time = timeit.timeit(lambda: renderer.render(data), number=iterations)
+                parse_time = timeit.timeit(lambda: parser.parse(io.BytesIO(body)), number=iterations)
+                results[label] = (render_time, parse_time)
+                self.stdout.write(
+                    f"  {label:<7} {len(body):>9,} bytes  "
+                    f"render {render_time / iterations * 1000:8.3f} ms  "
+                    f"parse {parse_time / iterations * 1000:8.3f} ms"
+                )
+
+            json_render, json_parse = results["json"]
+            orjson_render, orjson_parse = results["orjson"]
+            self.stdout.write(
+                f"  speedup render x{json_render / orjson_render:.1f}, parse x{json_parse / orjson_parse:.1f}"
+            )
+
+            body = ORJSONRenderer().render(data)
+            sizes = [f"gzip {len(gzip.compress(body, compresslevel=6)):,}"]
+            if brotli is not None:
+                sizes.append(f"br {len(brotli.compress(body, quality=5)):,}")
+            self.stdout.write(f"  compressed: {', '.join(sizes)} bytes")
+
+    def execution_list_page(self, rows):
+        now = timezone.now()
+        executions = []
+        for index in range(rows):
+            execution = Execution(
+                id=uuid.uuid4(),
+                status=Execution.Status.FAILED if index % 5 == 0 else Execution.Status.SUCCESS,
+                started_at=now - timedelta(minutes=index, seconds=4),
+                finished_at=now - timedelta(minutes=index),
+                attempt=index % 3,
+                created_at=now - timedelta(minutes=index, seconds=5),
+            )
+            execution.error_snippet = "HttpError 429 when requesting https://gmail.googleapis.com/gmail/v1/users/me/messages/send returned \"Too many requests\"" if index % 5 == 0 else None
+            execution.tasks_total = 4
+            for task_status in Task.Status.values:
+                setattr(execution, f"tasks_{task_status}", 0)
+            execution.tasks_success = 3 if index % 5 == 0 else 4
+            execution.tasks_failed = 1 if index % 5 == 0 else 0
+            executions.append(execution)
+
+        return {
+            "next": "http://localhost:8000/api/automations/5f0c/executions/?cursor=eyJ0IjoiMjAyNi0xMC0xOVQxMjowMDowMFoiLCJpIjoiYWJjIiwiciI6ZmFsc2V9",
+            "previous": None,
+            "results": ExecutionSummarySerializer(executions, many=True).data,
+        }
+
+    def execution_detail(self, tasks):
+        now = timezone.now()
+        email = {
+            "id": "18c2f0a1b2c3d4e5",
+            "thread_id": "18c2f0a1b2c3d4e5",
+            "from": "Ada Lovelace <ada@example.com>",
+            "to": "team@example.com",
+            "subject": "Quarterly report",
+            "snippet": "Please find attached the quarterly report for review ...",
+            "body": "Hello team,\n\n" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40,
+            "labels": ["INBOX", "UNREAD", "CATEGORY_UPDATES"],
+            "attachments": [
+                {"filename": f"report-{n}.pdf", "mime_type": "application/pdf", "size": 48213 * n}
+                for n in range(1, 4)
+            ],
+            "received_at": now,
+        }
+        return {
+            "id": uuid.uuid4(),
+            "status": Execution.Status.SUCCESS,
+            "started_at": now - timedelta(seconds=9),
+            "finished_at": now,
+            "attempt": 0,
+            "error": None,
+            "meta": {"duration_ms": 9000, "trigger": "new_email"},
+            "trigger_event": email,
+            "tasks": [
+                {
+                    "id": uuid.uuid4(),
+                    "status": Task.Status.SUCCESS,
+                    "input_payload": {"to": "ops@example.com", "subject": "Fwd: {{event.subject}}", "body": email["body"]},
+                    "output_payload": {"message_id": f"18c2f0a1b2c3d4{n:02d}", "echo": email},
+                    "started_at": now - timedelta(seconds=9 - n),
+                    "finished_at": now - timedelta(seconds=8 - n),
+                }
+                for n in range(tasks)
+            ],
+            "created_at": now - timedelta(seconds=10),
+        }
@@ -0,0 +1,65 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+
+_accepts_br = re.compile(r"\bbr\b")
+_accepts_gzip = re.compile(r"\bgzip\b")
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress non-streaming responses of at least API_COMPRESSION_MIN_SIZE
+    bytes, preferring brotli when it is installed and accepted, else gzip.
+
+    Like django.middleware.gzip.GZipMiddleware this weakens strong ETags,
+    since the encoded body differs byte-for-byte from the identity one.
+    Streaming responses are left untouched, and so is anything served as
+    text/event-stream: compressing server-sent events would buffer them.
+
+    MiddlewareMixin makes it async-capable: a sync-only middleware would
+    push every ASGI request, async views included, through the single
+    sync_to_async thread.
+    """
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if len(response.content) < settings.API_COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if brotli is not None and _accepts_br.search(accept_encoding):
+            encoding = "br"
+            content = brotli.compress(response.content, quality=settings.API_COMPRESSION_BROTLI_QUALITY)
+        elif _accepts_gzip.search(accept_encoding):
+            encoding = "gzip"
+            content = gzip.compress(response.content, compresslevel=settings.API_COMPRESSION_GZIP_LEVEL)
+        else:
+            return response
+
+        # Not worth it for incompressible bodies
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        response["Content-Encoding"] = encoding
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        return response
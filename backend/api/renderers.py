@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# orjson serializes datetime, date, time, UUID, dataclasses and dict/list/str
+# subclasses (ReturnDict, ErrorDetail) itself. Anything else (Decimal,
+# timedelta, lazy translation strings, querysets) goes through DRF's encoder
+# so the output matches rest_framework.renderers.JSONRenderer.
+_fallback = JSONEncoder().default
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Drop-in replacement for DRF's JSONRenderer backed by orjson."""
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return orjson.dumps(data, default=_fallback, option=ORJSON_OPTIONS)
@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.urls import reverse
 from django.utils.html import format_html
 
-from .models import Integration, Connection, Automation, Trigger, Step, EventRecord, Task, Execution, Workspace, WorkspaceMembership
+from .models import Integration, Connection, Automation, Trigger, TriggerCursor, Step, EventRecord, Task, Execution, ExecutionRollup, Workspace, WorkspaceMembership
 
 class EventRecordModelAdmin(admin.ModelAdmin):
     list_display = [
@@ -39,7 +39,9 @@ class TriggerModelAdmin(admin.ModelAdmin):
         "connection",
         "status",
         "last_run_at",
-        "last_tested_at"
+        "last_tested_at",
+        "poll_interval",
+        "next_poll_at"
     ]
 
 
@@ -99,9 +101,11 @@ admin.site.register(Integration)
 admin.site.register(Connection, ConnectionModelAdmin)
 admin.site.register(Automation, AutomationModelAdmin)
 admin.site.register(Trigger, TriggerModelAdmin)
+admin.site.register(TriggerCursor)
 admin.site.register(Step, StepModelAdmin)
 admin.site.register(EventRecord, EventRecordModelAdmin)
 admin.site.register(Task, TaskModelAdmin)
 admin.site.register(Execution)
+admin.site.register(ExecutionRollup)
 admin.site.register(Workspace, WorkspaceModelAdmin)
 admin.site.register(WorkspaceMembership)
\ No newline at end of file
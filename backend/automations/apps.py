@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AutomationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'automations'
+
+    def ready(self):
+        from automations import signals  # noqa: F401
@@ -2,17 +2,25 @@ from automations.models import Automation, EventRecord, Execution
 from triggers.tasks import handle_event_task
 from automations.tasks import run_automation_task
 
+from django.db import transaction
 from django.utils import timezone
 
 # NOTE: Might bundle into a class later idk
 def process_events(events):
+    """Persist and dispatch events. Returns how many were new."""
     from triggers.services import event_matches_trigger, persist_event
     print("PROCESSING EVENTS")
+    dispatched = 0
     for raw_event in events:
         persisted_event = persist_event(raw_event)
         # NOTE: Temporarily turning off idempotency check
         if not persisted_event.processed:
-            handle_event_task.delay(persisted_event.event_id)
+            # Only dispatch once the EventRecord is committed
+            transaction.on_commit(
+                lambda event_id=persisted_event.event_id: handle_event_task.delay(event_id)
+            )
+            dispatched += 1
+    return dispatched
 
 def handle_event(event):
     from triggers.services import event_matches_trigger
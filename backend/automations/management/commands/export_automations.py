@@ -0,0 +1,34 @@
+import sys
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from automations.models import Workspace
+from automations.services.transfer import iter_export_lines
+
+
+class Command(BaseCommand):
+    help = "Stream a workspace's automations as NDJSON, one automation per line."
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace", help="Workspace ID.")
+        parser.add_argument("--output", "-o", default="-", help="File to write, or - for stdout.")
+        parser.add_argument("--chunk-size", type=int, default=None, help="Automations per database round trip.")
+
+    def handle(self, *args, workspace, output, chunk_size, **options):
+        try:
+            workspace = Workspace.objects.get(pk=workspace)
+        except (Workspace.DoesNotExist, ValidationError):
+            raise CommandError(f"Workspace {workspace} does not exist.")
+
+        stream = sys.stdout.buffer if output == "-" else open(output, "wb")
+        count = 0
+        try:
+            for line in iter_export_lines(workspace, chunk_size=chunk_size):
+                stream.write(line)
+                count += 1
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+
+        self.stderr.write(f"Exported {count} automations.")
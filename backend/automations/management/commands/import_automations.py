@@ -0,0 +1,61 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from automations.models import Workspace
+from automations.services.transfer import import_automations
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Import NDJSON automations (see export_automations) into a workspace as drafts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace", help="Workspace ID.")
+        parser.add_argument("--owner", required=True, help="Email of the user who will own the automations.")
+        parser.add_argument("--input", "-i", default="-", help="File to read, or - for stdin.")
+        parser.add_argument(
+            "--connection", action="append", default=[], metavar="OLD_ID:NEW_ID",
+            help="Map an exported connection to one in the workspace. Repeatable.",
+        )
+        parser.add_argument("--batch-size", type=int, default=None, help="Automations per bulk insert.")
+
+    def handle(self, *args, workspace, owner, input, connection, batch_size, **options):
+        try:
+            workspace = Workspace.objects.get(pk=workspace)
+        except (Workspace.DoesNotExist, ValidationError):
+            raise CommandError(f"Workspace {workspace} does not exist.")
+
+        try:
+            owner = User.objects.get(email=owner)
+        except User.DoesNotExist:
+            raise CommandError(f"User {owner} does not exist.")
+
+        connection_map = {}
+        for pair in connection:
+            old_id, sep, new_id = pair.partition(":")
+            if not sep or not old_id or not new_id:
+                raise CommandError(f"Invalid connection mapping {pair!r}, expected OLD_ID:NEW_ID.")
+            connection_map[old_id] = new_id
+
+        stream = sys.stdin.buffer if input == "-" else open(input, "rb")
+        try:
+            report = import_automations(
+                stream,
+                workspace=workspace,
+                owner=owner,
+                connection_map=connection_map,
+                batch_size=batch_size,
+            )
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {'; '.join(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['imported']} automations, skipped {report['skipped']}."
+        ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automations', '0025_alter_connection_config_alter_connection_secrets'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trigger',
+            name='cursor',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automations', '0026_trigger_cursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trigger',
+            name='next_poll_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='trigger',
+            name='poll_interval',
+            field=models.PositiveIntegerField(default=30),
+        ),
+        migrations.AddIndex(
+            model_name='trigger',
+            index=models.Index(fields=['type', 'status', 'next_poll_at'], name='automations_type_ca8d73_idx'),
+        ),
+    ]
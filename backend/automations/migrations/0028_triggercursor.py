@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_trigger_cursors(apps, schema_editor):
+    Trigger = apps.get_model("automations", "Trigger")
+    TriggerCursor = apps.get_model("automations", "TriggerCursor")
+
+    TriggerCursor.objects.bulk_create([
+        TriggerCursor(
+            trigger_id=trigger_id,
+            token=legacy_cursor or {},
+            high_water_mark=last_run_at,
+        )
+        for trigger_id, legacy_cursor, last_run_at in Trigger.objects.filter(
+            type="poll"
+        ).values_list("id", "legacy_cursor", "last_run_at").iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automations', '0027_trigger_next_poll_at_trigger_poll_interval_and_more'),
+    ]
+
+    operations = [
+        # Free up the name for the reverse accessor of TriggerCursor
+        migrations.RenameField(
+            model_name='trigger',
+            old_name='cursor',
+            new_name='legacy_cursor',
+        ),
+        migrations.CreateModel(
+            name='TriggerCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('token', models.JSONField(blank=True, default=dict)),
+                ('high_water_mark', models.DateTimeField(blank=True, null=True)),
+                ('recent_ids', models.JSONField(blank=True, default=list)),
+                ('trigger', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='cursor', to='automations.trigger')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(copy_trigger_cursors, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='trigger',
+            name='legacy_cursor',
+        ),
+    ]
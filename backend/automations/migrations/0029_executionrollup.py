@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:38
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automations', '0028_triggercursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='execution',
+            name='rolled_up_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ExecutionRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('bucket', models.DateTimeField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('success', 'Success'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('duration_ms_sum', models.BigIntegerField(default=0)),
+                ('histogram', models.JSONField(default=list)),
+                ('automation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='automations.automation')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['automation', 'bucket'], name='automations_automat_761ac5_idx')],
+                'constraints': [models.UniqueConstraint(fields=('automation', 'bucket', 'status'), name='unique_execution_rollup')],
+            },
+        ),
+    ]
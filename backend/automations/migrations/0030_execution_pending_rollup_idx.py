@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automations', '0029_executionrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='execution',
+            index=models.Index(condition=models.Q(('rolled_up_at__isnull', True)), fields=['finished_at'], name='execution_pending_rollup_idx'),
+        ),
+    ]
@@ -129,11 +129,36 @@ class Trigger(TimeStampedModel):
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.DRAFT)
     last_tested_at = models.DateTimeField(null=True, blank=True)
     last_run_at = models.DateTimeField(null=True, blank=True)
+    # Adaptive polling: seconds between polls, grown or shrunk after each run.
+    # Scheduling clamps it to TRIGGER_POLL_MIN_INTERVAL.
+    poll_interval = models.PositiveIntegerField(default=30)
+    next_poll_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["type", "status", "next_poll_at"])]
 
     def __str__(self):
         return f"{self.type} trigger for {self.automation.id} ({self.integration.id})"
     
 
+class TriggerCursor(TimeStampedModel):
+    """
+    Polling position of a Trigger.
+
+    `token` is opaque provider state (e.g. Gmail's historyId). The
+    high-water mark is the newest event time seen, and `recent_ids` holds
+    the source IDs already seen at exactly that time, so events sharing a
+    timestamp are neither lost nor fetched twice.
+    """
+    trigger = models.OneToOneField(Trigger, on_delete=models.CASCADE, related_name="cursor")
+    token = models.JSONField(default=dict, blank=True)
+    high_water_mark = models.DateTimeField(null=True, blank=True)
+    recent_ids = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return f"Cursor for trigger {self.trigger_id}"
+
+
 class Step(TimeStampedModel):
     """
     Single step inside an Automation: either an action or condition/brancher.
@@ -207,12 +232,44 @@ class Execution(TimeStampedModel):
 
     # meta for metrics/observability (duration, cost)
     meta = models.JSONField(default=dict)
+    # set once the finished execution has been counted in ExecutionRollup
+    rolled_up_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         indexes = [
             models.Index(fields=["automation", "status"]),
             models.Index(fields=["created_at"]),
+            # The rollup backfill only ever reads executions not yet rolled up
+            models.Index(
+                fields=["finished_at"],
+                condition=models.Q(rolled_up_at__isnull=True),
+                name="execution_pending_rollup_idx",
+            ),
+        ]
+
+
+class ExecutionRollup(TimeStampedModel):
+    """
+    Hourly execution counts per automation and final status.
+
+    `histogram` holds counts of durations per bucket of
+    ROLLUP_DURATION_BUCKETS_MS, plus a trailing overflow bucket.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    automation = models.ForeignKey(Automation, on_delete=models.CASCADE, related_name="rollups")
+    bucket = models.DateTimeField()  # start of the hour
+    status = models.CharField(max_length=20, choices=Execution.Status.choices)
+    count = models.PositiveIntegerField(default=0)
+    duration_ms_sum = models.BigIntegerField(default=0)
+    histogram = models.JSONField(default=list)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["automation", "bucket", "status"], name="unique_execution_rollup"
+            )
         ]
+        indexes = [models.Index(fields=["automation", "bucket"])]
 
 
 class Task(TimeStampedModel):
@@ -1,7 +1,8 @@
 from .workspace import WorkspaceSerializer, WorkspaceMembershipSerializer
 from .integrations import IntegrationSerializer, IntegrationThinSerializer
-from .automations import AutomationSerializer, TriggerSerializer, ExecutionSerializer, StepCreateSerializer, StepDetailSerializer, StepUpdateSerializer, PublishAutomationSerializer
+from .automations import AutomationSerializer, TriggerSerializer, ExecutionSerializer, ExecutionSummarySerializer, execution_summary_queryset, StepCreateSerializer, StepDetailSerializer, StepUpdateSerializer, StepBulkSerializer, PublishAutomationSerializer
 from .connections import ConnectionSerializer, ConnectionDisplaySerializer
+from .mixins import SparseFieldsetMixin, sparse_context
 
 __all__ = [
     "AutomationSerializer",
@@ -1,8 +1,26 @@
+from django.db.models import Count, Q
+from django.db.models.functions import Left
 from rest_framework import serializers
 from automations.models import Automation, Trigger, Integration, Execution, Connection, Step, Task
+from automations.serializers.mixins import SparseFieldsetMixin
+from integrations.registry import get_action_catalog, get_trigger_catalog
 
+EXECUTION_ERROR_SNIPPET_LENGTH = 200
 
-class TriggerDisplaySerializer(serializers.ModelSerializer):
+
+def validate_draft_config(spec, config):
+    """
+    Type and enum checks for a step or trigger config that may still be a
+    draft. Required fields are enforced when the automation is published.
+    """
+    if spec is None or config is None:
+        return
+    _, errors = spec.validate(config, partial=True)
+    if errors:
+        raise serializers.ValidationError({"config": errors})
+
+
+class TriggerDisplaySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Trigger
         fields = [
@@ -13,7 +31,7 @@ class TriggerDisplaySerializer(serializers.ModelSerializer):
             "config",
         ]   
 
-class AutomationSerializer(serializers.ModelSerializer):
+class AutomationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     trigger = TriggerDisplaySerializer(read_only=True)
 
     class Meta:
@@ -32,6 +50,10 @@ class AutomationSerializer(serializers.ModelSerializer):
             "published_at"
         ]
         read_only_fields = ["id", "owner", "created_at", "updated_at", "published_at", "workspace", "trigger"]
+        expandable_fields = ["trigger"]
+        field_hints = {
+            "trigger": {"select_related": ["trigger"]},
+        }
 
 class TriggerSerializer(serializers.ModelSerializer):
     # TODO: Break into duty-specific serializers
@@ -92,6 +114,12 @@ class TriggerSerializer(serializers.ModelSerializer):
         if connection_id.integration_id != integration_id:
             raise serializers.ValidationError("Misconfigured connection")
 
+        if trigger_key is None and self.instance is not None:
+            trigger_key = self.instance.trigger_key
+        validate_draft_config(
+            get_trigger_catalog(integration_id).get(trigger_key), data.get("config")
+        )
+
         return data
     
     def create(self, validated_data):
@@ -101,7 +129,7 @@ class TriggerSerializer(serializers.ModelSerializer):
         connection = Connection.objects.get(id=connection_id)
         return Trigger.objects.create(integration=integration, connection=connection, **validated_data)
 
-class StepThinSerializer(serializers.ModelSerializer):
+class StepThinSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Step
         fields = [
@@ -111,7 +139,7 @@ class StepThinSerializer(serializers.ModelSerializer):
             "action_name"
         ]
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     step = StepThinSerializer()
     duration = serializers.SerializerMethodField()
 
@@ -128,6 +156,11 @@ class TaskSerializer(serializers.ModelSerializer):
             "finished_at",
             "duration"   
         ]
+        expandable_fields = ["step"]
+        field_hints = {
+            "step": {"select_related": ["step"]},
+            "duration": {"only": ["started_at", "finished_at"]},
+        }
 
     def get_duration(self, obj):
         if not obj.started_at or not obj.finished_at:
@@ -135,7 +168,7 @@ class TaskSerializer(serializers.ModelSerializer):
         
         return (obj.finished_at - obj.started_at).total_seconds()
 
-class ExecutionSerializer(serializers.ModelSerializer):
+class ExecutionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     automation = AutomationSerializer()
     tasks = TaskSerializer(many=True, read_only=True)
 
@@ -153,6 +186,65 @@ class ExecutionSerializer(serializers.ModelSerializer):
             "meta",
             "created_at",
         ]
+        expandable_fields = ["automation", "tasks"]
+        field_hints = {
+            "automation": {"select_related": ["automation"]},
+            "tasks": {"prefetch_related": ["tasks"]},
+        }
+
+class ExecutionSummarySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Lightweight execution row for list views.
+
+    Expects the queryset from `execution_summary_queryset`, which defers the
+    large JSON columns and annotates the error snippet and task counts.
+    """
+    duration = serializers.SerializerMethodField()
+    error = serializers.CharField(source="error_snippet", read_only=True)
+    task_counts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Execution
+        fields = [
+            "id",
+            "status",
+            "started_at",
+            "finished_at",
+            "duration",
+            "attempt",
+            "error",
+            "task_counts",
+            "created_at",
+        ]
+
+    def get_duration(self, obj):
+        if not obj.started_at or not obj.finished_at:
+            return None
+
+        return (obj.finished_at - obj.started_at).total_seconds()
+
+    def get_task_counts(self, obj):
+        counts = {
+            task_status: getattr(obj, f"tasks_{task_status}")
+            for task_status in Task.Status.values
+        }
+        counts["total"] = obj.tasks_total
+        return counts
+
+
+def execution_summary_queryset(queryset):
+    """Project executions down to what ExecutionSummarySerializer renders."""
+    return queryset.only(
+        "id", "automation_id", "status", "started_at", "finished_at", "attempt", "created_at"
+    ).annotate(
+        error_snippet=Left("error", EXECUTION_ERROR_SNIPPET_LENGTH),
+        tasks_total=Count("tasks"),
+        **{
+            f"tasks_{task_status}": Count("tasks", filter=Q(tasks__status=task_status))
+            for task_status in Task.Status.values
+        }
+    )
+
 
 class StepCreateSerializer(serializers.ModelSerializer):
     automation = serializers.PrimaryKeyRelatedField(
@@ -182,6 +274,14 @@ class StepCreateSerializer(serializers.ModelSerializer):
             "action_name",
             "config",
         ]
+
+    def validate(self, attrs):
+        integration = attrs.get("integration")
+        if integration and attrs.get("action_name"):
+            validate_draft_config(
+                get_action_catalog(integration.id).get(attrs["action_name"]), attrs.get("config")
+            )
+        return attrs
     
 class StepDetailSerializer(serializers.ModelSerializer):
     class Meta:
@@ -231,33 +331,108 @@ class StepUpdateSerializer(serializers.ModelSerializer):
         """
         Cross-field validation for workflow correctness.
         """
+        return validate_step_attrs(attrs, self.instance)
 
-        # get current instance values (important for partial updates)
-        instance = self.instance
 
-        kind = attrs.get("kind", instance.kind if instance else None)
-        action_name = attrs.get(
-            "action_name",
-            instance.action_name if instance else None
-        )
-        integration = attrs.get(
-            "integration",
-            instance.integration if instance else None
-        )
-        connection = attrs.get(
-            "connection",
-            instance.connection if instance else None
+def validate_step_attrs(attrs, instance):
+    """
+    Cross-field checks for a step's attrs applied onto `instance` (None
+    for a new step). Shared by single and bulk step edits.
+    """
+    # get current instance values (important for partial updates)
+    kind = attrs.get("kind", instance.kind if instance else None)
+    action_name = attrs.get(
+        "action_name",
+        instance.action_name if instance else None
+    )
+    integration = attrs.get(
+        "integration",
+        instance.integration if instance else None
+    )
+    connection = attrs.get(
+        "connection",
+        instance.connection if instance else None
+    )
+
+    # 2. If integration is set, connection should be compatible
+    if integration and connection:
+        if connection.integration_id != integration.id:
+            raise serializers.ValidationError({
+                "connection": "Connection does not belong to selected integration."
+            })
+
+    # 3. Config must fit the selected action's schema
+    if integration and action_name:
+        validate_draft_config(
+            get_action_catalog(integration.id).get(action_name),
+            attrs.get("config", instance.config if instance else None),
         )
 
-        # 2. If integration is set, connection should be compatible
-        if integration and connection:
-            if connection.integration_id != integration.id:
-                raise serializers.ValidationError({
-                    "connection": "Connection does not belong to selected integration."
-                })
+    return attrs
+
+
+class StepBulkItemSerializer(StepUpdateSerializer):
+    """One entry of a bulk step edit: existing steps carry their `id`."""
+    id = serializers.UUIDField(required=False)
 
+    class Meta(StepUpdateSerializer.Meta):
+        fields = ["id"] + StepUpdateSerializer.Meta.fields
+        extra_kwargs = {
+            **StepUpdateSerializer.Meta.extra_kwargs,
+            # position in the list is the order
+            "order": {"required": False, "read_only": True},
+        }
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # Only the automation's own workspace connections can be attached
+        automation = self.context.get("automation")
+        if automation is not None:
+            fields["connection"].queryset = Connection.objects.filter(workspace_id=automation.workspace_id)
+        return fields
+
+    def validate(self, attrs):
+        # Checked in StepBulkSerializer.validate_steps, merged onto the
+        # stored step for entries that carry an `id`
         return attrs
-    
+
+
+class StepBulkSerializer(serializers.Serializer):
+    """
+    The complete, ordered step list of an automation. Steps missing from
+    the list are deleted; entries without an `id` are created.
+    """
+    steps = StepBulkItemSerializer(many=True)
+
+    def validate_steps(self, steps):
+        automation = self.context["automation"]
+        ids = [step["id"] for step in steps if "id" in step]
+
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Each step may appear only once.")
+
+        existing = {
+            step.id: step
+            for step in automation.steps.select_related("integration", "connection")
+        }
+        unknown = [str(step_id) for step_id in ids if step_id not in existing]
+        if unknown:
+            raise serializers.ValidationError(
+                f"Steps not belonging to this automation: {unknown}"
+            )
+
+        errors = []
+        for step in steps:
+            try:
+                validate_step_attrs(step, existing.get(step.get("id")))
+                errors.append({})
+            except serializers.ValidationError as e:
+                errors.append(e.detail)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return steps
+
+
 class PublishAutomationSerializer(serializers.Serializer):
     step_ids = serializers.ListField(
         child=serializers.UUIDField(),
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from automations.models import Connection, Integration, Workspace
+from integrations.schemas import get_integration_validator
 
 
 class ConnectionSerializer(serializers.ModelSerializer):
@@ -42,29 +43,17 @@ class ConnectionSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"workspace_id": "Invalid workspace ID."})
 
         # -------------------------
-        # 3. Validate config using config_schema6
+        # 3. Validate config using config_schema
         # -------------------------
-        schema = integration.config_schema or {}
-        config_errors = {}
-
-        for field, rules in schema.items():
-            field_required = rules.get("required", False)
-
-            # Missing?
-            if field_required and field not in config and field not in secrets:
-                config_errors[field] = "This field is required."
-
-            # Type check (optional)
-            if field in config:
-                expected_type = rules.get("type")
-                if expected_type == "string" and not isinstance(config[field], str):
-                    config_errors[field] = "Must be a string."
-                elif expected_type == "number" and not isinstance(config[field], (int, float)):
-                    config_errors[field] = "Must be a number."
+        validate_config = get_integration_validator(integration)
+        config, config_errors = validate_config(config, provided=secrets)
 
         if config_errors:
             raise serializers.ValidationError({"config": config_errors})
 
+        if "config" in attrs:
+            attrs["config"] = config
+
         # Save resolved objects for create()
         attrs["integration"] = integration
         attrs["workspace"] = workspace
@@ -25,12 +25,12 @@ class IntegrationSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
     def get_triggers(self, obj):
-        service_cls = INTEGRATION_REGISTRY[obj.id]
-        return service_cls.as_dict()["triggers"] if service_cls else {}
+        service_cls = INTEGRATION_REGISTRY.get(obj.id)
+        return service_cls.TRIGGERS if service_cls else {}
 
     def get_actions(self, obj):
-        service_cls = INTEGRATION_REGISTRY[obj.id]
-        return service_cls.as_dict()["actions"] if service_cls else {}
+        service_cls = INTEGRATION_REGISTRY.get(obj.id)
+        return service_cls.ACTIONS if service_cls else {}
 
 
 class IntegrationThinSerializer(serializers.ModelSerializer):
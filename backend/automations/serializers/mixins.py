@@ -0,0 +1,166 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def parse_field_list(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def sparse_context(request, **extra):
+    """
+    Serializer context carrying the `?fields=` and `?expand=` selections.
+
+    Both take comma-separated names, dotted for nested serializers
+    (`?fields=id,automation.name&expand=tasks`). An absent `expand` keeps
+    every expandable relation, so responses only change when a client asks.
+    """
+    return {
+        "request": request,
+        "fields": parse_field_list(request.query_params.get("fields")),
+        "expand": parse_field_list(request.query_params.get("expand")),
+        **extra,
+    }
+
+
+def scoped(names, path, *, empty_means_all):
+    # Selections that apply under `path`, with the path prefix removed
+    if names is None or not path:
+        return names
+    prefix = f"{path}."
+    inner = {name[len(prefix):] for name in names if name.startswith(prefix)}
+    if not inner and empty_means_all:
+        return None
+    return inner
+
+
+def nested_serializer_class(field):
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    if isinstance(field, SparseFieldsetMixin):
+        return type(field)
+    return None
+
+
+class SparseFieldsetMixin:
+    """
+    Lets clients pick fields with `?fields=` and relations with `?expand=`,
+    and derives the matching queryset shape.
+
+    Meta options:
+      expandable_fields: nested relations rendered only when expanded.
+      field_hints: per field, the model columns it reads ("only") and the
+        relation it needs ("select_related" or "prefetch_related").
+
+    Selections only apply when the context comes from `sparse_context`, so
+    writes and internal uses see every field.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if "fields" not in self.context and "expand" not in self.context:
+            return fields
+
+        keep = self.selected_field_names(fields, self.context, self.field_path())
+        return {name: field for name, field in fields.items() if name in keep}
+
+    def field_path(self):
+        parts = []
+        node = self
+        while getattr(node, "parent", None) is not None:
+            if node.field_name:
+                parts.append(node.field_name)
+            node = node.parent
+        return ".".join(reversed(parts))
+
+    @classmethod
+    def selected_field_names(cls, fields, context, path=""):
+        requested = scoped(context.get("fields"), path, empty_means_all=True)
+        expand = scoped(context.get("expand"), path, empty_means_all=False)
+
+        requested = None if requested is None else {name.split(".")[0] for name in requested}
+        expand = None if expand is None else {name.split(".")[0] for name in expand}
+        expandable = set(getattr(cls.Meta, "expandable_fields", ()))
+
+        selected = set()
+        for name in fields:
+            if name in expandable and expand is not None:
+                if name in expand:
+                    selected.add(name)
+            elif requested is None or name in requested:
+                selected.add(name)
+        return selected
+
+    @classmethod
+    def query_plan(cls, context, path=""):
+        """(only, select_related, prefetch_related) for the selected fields."""
+        model = cls.Meta.model
+        fields = cls().fields
+        hints = getattr(cls.Meta, "field_hints", {})
+        selected = cls.selected_field_names(fields, context, path)
+
+        only = {model._meta.pk.name}
+        select_related, prefetch_related = [], []
+
+        for name in selected:
+            hint = hints.get(name, {})
+            field = fields[name]
+
+            if "only" in hint:
+                only.update(hint["only"])
+            else:
+                source = field.source.split(".")[0]
+                try:
+                    model_field = model._meta.get_field(source)
+                except FieldDoesNotExist:
+                    model_field = None
+                if model_field is not None and model_field.concrete and not model_field.many_to_many:
+                    only.add(model_field.name)
+
+            nested_cls = nested_serializer_class(field)
+            child_path = f"{path}.{name}" if path else name
+
+            for relation in hint.get("select_related", []):
+                select_related.append(relation)
+                if nested_cls:
+                    nested_only, nested_select, nested_prefetch = nested_cls.query_plan(context, child_path)
+                    only.update(f"{relation}__{inner}" for inner in nested_only)
+                    select_related.extend(f"{relation}__{inner}" for inner in nested_select)
+                    prefetch_related.extend(
+                        Prefetch(f"{relation}__{inner.prefetch_through}", queryset=inner.queryset)
+                        if isinstance(inner, Prefetch) else f"{relation}__{inner}"
+                        for inner in nested_prefetch
+                    )
+
+            for relation in hint.get("prefetch_related", []):
+                if nested_cls:
+                    # Nested relations of prefetched rows are fetched with them
+                    _, nested_select, nested_prefetch = nested_cls.query_plan(context, child_path)
+                    queryset = nested_cls.Meta.model.objects.select_related(
+                        *nested_select
+                    ).prefetch_related(*nested_prefetch)
+                    prefetch_related.append(Prefetch(relation, queryset=queryset))
+                else:
+                    prefetch_related.append(relation)
+
+        return only, select_related, prefetch_related
+
+    @classmethod
+    def optimize_queryset(cls, queryset, context, *, required=()):
+        """
+        Apply the query plan: joins and prefetches for the selected
+        relations, and `only()` when the client restricted the fields.
+        `required` names columns the caller needs regardless (e.g. the
+        pagination keys).
+        """
+        only, select_related, prefetch_related = cls.query_plan(context)
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        if context.get("fields") is not None:
+            queryset = queryset.only(*only, *required)
+        return queryset
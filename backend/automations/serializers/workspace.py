@@ -2,11 +2,12 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
 from automations.models import Workspace, WorkspaceMembership
+from automations.serializers.mixins import SparseFieldsetMixin
 
 
 User = get_user_model()
 
-class WorkspaceMembershipSerializer(serializers.ModelSerializer):
+class WorkspaceMembershipSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     workspace_id = serializers.UUIDField(source="workspace.id")
     name = serializers.CharField(source='workspace.name')
 
@@ -14,9 +15,13 @@ class WorkspaceMembershipSerializer(serializers.ModelSerializer):
         model = WorkspaceMembership
         fields = ["name", "workspace_id", "role", "joined_at"]
         read_only_fields = ["joined_at"]
+        field_hints = {
+            "name": {"only": ["workspace"], "select_related": ["workspace"]},
+            "workspace_id": {"only": ["workspace"]},
+        }
 
 
-class WorkspaceSerializer(serializers.ModelSerializer):
+class WorkspaceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
     owner_detail = serializers.SerializerMethodField(read_only=True)
     members = WorkspaceMembershipSerializer(source="workspacemembership_set", many=True, read_only=True)
@@ -34,6 +39,11 @@ class WorkspaceSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "owner", "created_at", "updated_at"]
+        expandable_fields = ["members"]
+        field_hints = {
+            "owner_detail": {"only": ["owner"], "select_related": ["owner"]},
+            "members": {"prefetch_related": ["workspacemembership_set"]},
+        }
 
     def get_owner_detail(self, obj):
         return {
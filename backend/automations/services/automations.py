@@ -1,58 +1,57 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db import transaction
 
-from integrations.registry import get_integration_service
-from automations.models import Step, Automation, Trigger
+from integrations.registry import ConfigSpec, get_action_catalog, get_trigger_catalog
+from integrations.schemas import format_config_errors
+from automations.models import Step, Automation, Trigger, Connection
 from automations.exceptions import AutomationValidationError
 
 
-def validate_step_config(step: Step) -> list[str]:
-    errors = []
-
+def validate_step_config(step: Step, action: ConfigSpec) -> list[str]:
     if not step.config:
         return ["Step has no config provided."]
-    
-    service_cls = get_integration_service(step.integration.id, step.connection)
 
-    action_schema = service_cls.get_action_schema(step.action_name)
-    if not action_schema:
+    if not action.validate:
         return [f"Action schema not found for '{step.action_name}'."]
-    
-    required_fields = [key for key, field in action_schema.items() if field.get("required") is True]
 
-    for field in required_fields:
-        value = step.config.get(field)
-        if value is None:
-            errors.append(f"Config is missing required field '{field}'.")
-        elif isinstance(value, str) and not value.strip():
-            errors.append(f"Config field '{field}' cannot be blank.")
-
-    return errors
+    _, errors = action.validate(step.config)
+    return format_config_errors(errors)
 
 
 def validate_step(step) -> list[str]:
-    """Returns a list of error strings for this step. Empty = valid."""
+    """
+    Returns a list of error strings for this step. Empty = valid.
+
+    Checks run against the class-level action catalog, so no service is
+    instantiated. Expects `integration` and `connection` to be selected
+    with the step.
+    """
     errors = []
+    connection = step.connection
 
-    if not step.connection:
+    if not step.integration_id:
+        errors.append("Step has no integration selected.")
+
+    if not connection:
         errors.append("Step has no connection assigned.")
-    elif not step.connection.status == "active":
-        errors.append(f"Connection '{step.connection.name}' is inactive or expired.")
-    elif step.connection.integration != step.integration:
+    elif not connection.status == Connection.Status.ACTIVE:
+        errors.append(f"Connection '{connection.display_name}' is inactive or expired.")
+    elif step.integration_id and connection.integration_id != step.integration_id:
         errors.append(
-            f"Connection '{step.connection.name}' does not match "
+            f"Connection '{connection.display_name}' does not match "
             f"integration '{step.integration.name}'."
         )
 
     if not step.action_name:
         errors.append("No action selected.")
-    else:
-        valid_actions = get_integration_service(step.integration.id, step.connection).get_action_keys()
-        if step.action_name not in valid_actions:
+    elif step.integration_id:
+        action = get_action_catalog(step.integration_id).get(step.action_name)
+        if action is None:
             errors.append(f"Action '{step.action_name}' is not valid for this integration.")
         else:
-            errors.extend(validate_step_config(step))
+            errors.extend(validate_step_config(step, action))
 
     return errors
 
@@ -70,6 +69,11 @@ def validate_trigger(trigger) -> list[str]:
     if not trigger.status in [Trigger.Status.READY, Trigger.Status.ACTIVE]: 
         errors.append("Trigger is not properly configured or has not been tested.")
 
+    spec = get_trigger_catalog(trigger.integration_id).get(trigger.trigger_key)
+    if spec is not None:
+        _, config_errors = spec.validate(trigger.config)
+        errors.extend(format_config_errors(config_errors))
+
     return errors
 
 
@@ -86,7 +90,7 @@ def publish_automation(automation) -> Automation:
         all_errors['trigger'] = trigger_errors
 
     step_errors = {}
-    for step in automation.steps.all():
+    for step in automation.steps.select_related("integration", "connection"):
         errors = validate_step(step)
         if errors:
             step_errors[str(step.id)] = errors
@@ -102,11 +106,69 @@ def publish_automation(automation) -> Automation:
     now = timezone.now()
 
     trigger.status = Trigger.Status.ACTIVE
-    trigger.save(update_fields=["status"])
+    # Poll a freshly published trigger right away at the fastest rate
+    trigger.poll_interval = settings.TRIGGER_POLL_MIN_INTERVAL
+    trigger.next_poll_at = now
+    trigger.save(update_fields=["status", "poll_interval", "next_poll_at"])
 
     automation.steps.all().update(status=Step.Status.READY)
     automation.status = Automation.Status.ENABLED
     automation.published_at = now
     automation.save(update_fields=['status', 'published_at'])
 
-    return automation
\ No newline at end of file
+    return automation
+
+
+STEP_BULK_FIELDS = ["kind", "integration", "connection", "action_name", "config"]
+
+
+@transaction.atomic
+def replace_steps(automation, items) -> list[Step]:
+    """
+    Make `items` (validated StepBulkSerializer entries, in order) the
+    automation's complete step list, in a fixed number of queries.
+
+    Orders are unique per automation, so kept steps are first parked above
+    every current order, then renumbered 1..n. No intermediate state ever
+    collides, whatever the permutation.
+    """
+    automation = Automation.objects.select_for_update().get(pk=automation.pk)
+    existing = {step.id: step for step in Step.objects.select_for_update().filter(automation=automation)}
+
+    kept_ids = {item["id"] for item in items if "id" in item}
+    removed_ids = [step_id for step_id in existing if step_id not in kept_ids]
+    if removed_ids:
+        Step.objects.filter(id__in=removed_ids).delete()
+
+    kept, created = [], []
+    for position, item in enumerate(items, start=1):
+        step = existing[item["id"]] if "id" in item else Step(automation=automation)
+        for field in STEP_BULK_FIELDS:
+            if field in item:
+                setattr(step, field, item[field])
+        step.order = position
+        step.status = Step.Status.DRAFT
+        (kept if "id" in item else created).append(step)
+
+    if kept:
+        # Phase 1: move out of the way of the final orders
+        park_from = max(max(step.order for step in existing.values()), len(items)) + 1
+        final_orders = [step.order for step in kept]
+        for offset, step in enumerate(kept):
+            step.order = park_from + offset
+        Step.objects.bulk_update(kept, ["order"])
+
+        # Phase 2: final orders and content
+        for step, order in zip(kept, final_orders):
+            step.order = order
+        Step.objects.bulk_update(kept, ["order", "status", *STEP_BULK_FIELDS])
+
+    if created:
+        Step.objects.bulk_create(created)
+
+    # Any edit sends a published automation back to draft, once
+    if automation.status != Automation.Status.DRAFT:
+        automation.status = Automation.Status.DRAFT
+        automation.save(update_fields=["status"])
+
+    return sorted(kept + created, key=lambda step: step.order)
@@ -0,0 +1,111 @@
+import hashlib
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from api.renderers import ORJSONRenderer
+from automations.models import Integration, Trigger
+from automations.serializers import IntegrationSerializer, IntegrationThinSerializer
+from integrations.registry import INTEGRATION_REGISTRY
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    body: bytes
+    etag: str
+
+
+class IntegrationCatalog:
+    """
+    Per-process cache of rendered catalog responses.
+
+    The catalog (Integration rows plus the TRIGGERS/ACTIONS declared by the
+    registered services) only changes on deploy, so each response is
+    rendered to bytes once and served with a strong ETag derived from its
+    content. Integration saves clear it through automations.signals.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def clear(self):
+        self._entries = {}
+
+    def get(self, key, build, *, store=True):
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        data = build()
+        if data is None:
+            return None
+
+        body = ORJSONRenderer().render(data)
+        entry = CatalogEntry(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+        if store:
+            self._entries[key] = entry
+        return entry
+
+
+catalog = IntegrationCatalog()
+
+
+def build_integration_list():
+    return IntegrationThinSerializer(Integration.objects.all(), many=True).data
+
+
+def build_integration_detail(integration_id):
+    integration = Integration.objects.filter(id=integration_id).first()
+    if not integration:
+        return None
+    return IntegrationSerializer(integration).data
+
+
+def build_trigger_list(integration_id, trigger_type=None):
+    service_cls = INTEGRATION_REGISTRY.get(integration_id)
+    if not service_cls:
+        return None
+
+    triggers = service_cls.TRIGGERS
+    if trigger_type:
+        triggers = {
+            key: value
+            for key, value in triggers.items()
+            if value.get("type") == trigger_type
+        }
+    return triggers
+
+
+def build_action_list(integration_id):
+    service_cls = INTEGRATION_REGISTRY.get(integration_id)
+    if not service_cls:
+        return None
+    return service_cls.ACTIONS
+
+
+def is_known_trigger_type(trigger_type) -> bool:
+    # Arbitrary ?type= values are answered but not cached
+    return not trigger_type or trigger_type in Trigger.Type.values
+
+
+def catalog_response(request, entry):
+    """Serve a catalog entry, answering 304 when the client's copy is current."""
+    if entry is None:
+        return HttpResponse(
+            ORJSONRenderer().render({"detail": "Not found."}),
+            status=404,
+            content_type="application/json",
+        )
+
+    # Weak comparison: compressed responses carry a W/ prefixed ETag
+    if_none_match = request.headers.get("If-None-Match", "")
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if entry.etag in tags or if_none_match.strip() == "*":
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(entry.body, content_type="application/json")
+
+    response["ETag"] = entry.etag
+    response["Cache-Control"] = f"public, max-age={settings.INTEGRATION_CATALOG_MAX_AGE}"
+    return response
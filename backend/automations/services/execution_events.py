@@ -0,0 +1,86 @@
+import json
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from automations.models import Execution
+
+
+_client = None
+
+
+def get_redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.EXECUTION_EVENTS_REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _client
+
+
+def get_async_redis():
+    # One client per stream: asyncio connections are bound to their event loop
+    return aioredis.Redis.from_url(settings.EXECUTION_EVENTS_REDIS_URL)
+
+
+def execution_channel(execution_id) -> str:
+    return f"execution:{execution_id}"
+
+
+def is_finished(status) -> bool:
+    return status in (
+        Execution.Status.SUCCESS,
+        Execution.Status.FAILED,
+        Execution.Status.CANCELLED,
+    )
+
+
+def execution_state(execution) -> dict:
+    return {
+        "id": execution.id,
+        "status": execution.status,
+        "started_at": execution.started_at,
+        "finished_at": execution.finished_at,
+        "attempt": execution.attempt,
+        "error": execution.error,
+    }
+
+
+def task_state(task) -> dict:
+    return {
+        "id": task.id,
+        "step_id": task.step_id,
+        "status": task.status,
+        "started_at": task.started_at,
+        "finished_at": task.finished_at,
+        "error": task.error,
+    }
+
+
+def encode_event(event_type, data) -> str:
+    return json.dumps({"type": event_type, "data": data}, cls=DjangoJSONEncoder)
+
+
+def publish_execution_event(execution_id, event_type, data):
+    """
+    Publish an execution or task transition to stream subscribers.
+
+    Streaming is best effort: a Redis hiccup must never fail the run that
+    is being reported on.
+    """
+    try:
+        get_redis().publish(execution_channel(execution_id), encode_event(event_type, data))
+    except redis.RedisError as e:
+        print(f"Could not publish {event_type} event for execution {execution_id}: {e}")
+
+
+def publish_execution(execution):
+    publish_execution_event(execution.id, "execution", execution_state(execution))
+
+
+def publish_task(task):
+    publish_execution_event(task.execution_id, "task", task_state(task))
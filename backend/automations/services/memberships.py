@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from automations.models import WorkspaceMembership
+
+
+def membership_cache_key(user_id) -> str:
+    return f"workspace_roles_{user_id}"
+
+
+def get_workspace_roles(user) -> dict:
+    """
+    Map of workspace ID (str) to the user's role, for every workspace the
+    user belongs to. Cached briefly and invalidated by automations.signals
+    when memberships change.
+    """
+    if not user or not user.is_authenticated:
+        return {}
+
+    key = membership_cache_key(user.pk)
+    roles = cache.get(key)
+    if roles is None:
+        roles = {
+            str(workspace_id): role
+            for workspace_id, role in WorkspaceMembership.objects.filter(
+                user_id=user.pk
+            ).values_list("workspace_id", "role")
+        }
+        cache.set(key, roles, settings.WORKSPACE_MEMBERSHIP_CACHE_TTL)
+    return roles
+
+
+def invalidate_workspace_roles(*user_ids):
+    cache.delete_many([membership_cache_key(user_id) for user_id in user_ids])
+
+
+def request_workspace_roles(request) -> dict:
+    # Memoised on the request so a view never asks the cache twice
+    roles = getattr(request, "_workspace_roles", None)
+    if roles is None:
+        roles = get_workspace_roles(request.user)
+        request._workspace_roles = roles
+    return roles
+
+
+def workspace_ids(request) -> list:
+    """IDs of the requesting user's workspaces, for `workspace_id__in` filters."""
+    return list(request_workspace_roles(request))
+
+
+def workspace_role(request, workspace_id):
+    """The requesting user's role in the workspace, or None if not a member."""
+    return request_workspace_roles(request).get(str(workspace_id))
@@ -0,0 +1,150 @@
+import time
+from collections import Counter
+
+from automations.models import EventRecord, Step, Trigger
+
+# Distinct error messages kept per step
+MAX_STEP_ERRORS = 5
+
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def latency_summary(samples_ms) -> dict:
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return {"avg": None, "p50": None, "p95": None, "max": None}
+    return {
+        "avg": round(sum(ordered) / len(ordered), 3),
+        "p50": round(percentile(ordered, 0.50), 3),
+        "p95": round(percentile(ordered, 0.95), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def recorded_events(trigger, *, since=None, until=None, limit=None):
+    """EventRecords the trigger would have received, oldest first."""
+    events = EventRecord.objects.filter(
+        integration=trigger.integration_id,
+        trigger=trigger.trigger_key,
+    ).order_by("occurred_at", "id")
+    if since:
+        events = events.filter(occurred_at__gte=since)
+    if until:
+        events = events.filter(occurred_at__lt=until)
+    if limit:
+        events = events[:limit]
+    return events
+
+
+class StepStats:
+    def __init__(self, step):
+        self.step = step
+        self.latencies_ms = []
+        self.failures = 0
+        self.results = Counter()
+        self.errors = []
+
+    def record(self, elapsed_ms, *, result=None, error=None):
+        self.latencies_ms.append(elapsed_ms)
+        if error is not None:
+            self.failures += 1
+            message = f"{type(error).__name__}: {error}"
+            if message not in self.errors and len(self.errors) < MAX_STEP_ERRORS:
+                self.errors.append(message)
+        elif self.step.kind == Step.Kind.CONDITION:
+            # Conditions report how they evaluated; unevaluated is None
+            self.results[str(result).lower() if result is not None else "none"] += 1
+
+    def as_dict(self) -> dict:
+        data = {
+            "id": str(self.step.id),
+            "order": self.step.order,
+            "kind": self.step.kind,
+            "action_name": self.step.action_name,
+            "runs": len(self.latencies_ms),
+            "failures": self.failures,
+            "latency_ms": latency_summary(self.latencies_ms),
+            "errors": self.errors,
+        }
+        if self.step.kind == Step.Kind.CONDITION:
+            data["results"] = dict(self.results)
+        return data
+
+
+def replay_automation(automation, events) -> dict:
+    """
+    Run recorded events through the automation's real step pipeline with
+    mode="test", so actions validate and render their work but cause no
+    side effects and call no provider APIs. Nothing is persisted: no
+    Execution or Task rows, and the events stay as they are.
+
+    Mirrors the live run: events the trigger filters out skip the steps,
+    and a failing step ends that event's pipeline. Returns per-step latency
+    and outcomes plus the overall throughput.
+    """
+    from automations.tasks import execute_step
+    from triggers.services import event_matches_trigger
+
+    trigger = Trigger.objects.get(automation=automation)
+    steps = list(
+        Step.objects.filter(automation=automation).select_related("integration", "connection").order_by("order")
+    )
+    stats = [StepStats(step) for step in steps]
+
+    counts = Counter()
+    match_ms = []
+    pipeline_ms = []
+    started = time.perf_counter()
+
+    for event in events:
+        counts["events"] += 1
+
+        tick = time.perf_counter()
+        matched = event_matches_trigger(event, trigger)
+        match_ms.append((time.perf_counter() - tick) * 1000)
+        if not matched:
+            counts["filtered"] += 1
+            continue
+
+        context = {
+            "event": event.payload,
+            "step_results": {},
+        }
+        pipeline_started = time.perf_counter()
+        failed = False
+
+        for step, step_stats in zip(steps, stats):
+            tick = time.perf_counter()
+            try:
+                result = execute_step(step, context, mode="test")
+            except Exception as e:
+                step_stats.record((time.perf_counter() - tick) * 1000, error=e)
+                failed = True
+                break
+            step_stats.record((time.perf_counter() - tick) * 1000, result=result)
+            context["step_results"][str(step.id)] = result
+
+        pipeline_ms.append((time.perf_counter() - pipeline_started) * 1000)
+        counts["failed" if failed else "succeeded"] += 1
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        "automation": str(automation.id),
+        "mode": "test",
+        "events": counts["events"],
+        "filtered": counts["filtered"],
+        "succeeded": counts["succeeded"],
+        "failed": counts["failed"],
+        "duration_ms": round(elapsed * 1000, 3),
+        "events_per_second": round(counts["events"] / elapsed, 1) if elapsed else None,
+        "trigger_match_ms": latency_summary(match_ms),
+        "pipeline_ms": latency_summary(pipeline_ms),
+        "steps": [step_stats.as_dict() for step_stats in stats],
+    }
@@ -0,0 +1,187 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from automations.models import Execution, ExecutionRollup
+
+
+# Upper bounds (ms) of the duration histogram buckets; durations above the
+# last bound land in a trailing overflow bucket.
+ROLLUP_DURATION_BUCKETS_MS = [100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000]
+
+TERMINAL_STATUSES = [
+    Execution.Status.SUCCESS,
+    Execution.Status.FAILED,
+    Execution.Status.CANCELLED,
+]
+
+
+def hour_bucket(value):
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def execution_duration_ms(execution) -> int:
+    started_at = execution.started_at or execution.created_at
+    if not started_at or not execution.finished_at:
+        return 0
+    return max(int((execution.finished_at - started_at).total_seconds() * 1000), 0)
+
+
+def histogram_index(duration_ms: int) -> int:
+    for index, bound in enumerate(ROLLUP_DURATION_BUCKETS_MS):
+        if duration_ms <= bound:
+            return index
+    return len(ROLLUP_DURATION_BUCKETS_MS)
+
+
+def record_execution(execution) -> bool:
+    """
+    Fold a finished execution into its hourly rollup.
+
+    Claims the execution through `rolled_up_at` first, so retries and the
+    periodic backfill never count the same execution twice. Returns whether
+    the execution was recorded.
+    """
+    if execution.status not in TERMINAL_STATUSES or not execution.finished_at:
+        return False
+
+    duration_ms = execution_duration_ms(execution)
+
+    with transaction.atomic():
+        claimed = Execution.objects.filter(
+            id=execution.id,
+            rolled_up_at__isnull=True,
+        ).update(rolled_up_at=timezone.now())
+        if not claimed:
+            return False
+
+        rollup, _ = ExecutionRollup.objects.select_for_update().get_or_create(
+            automation_id=execution.automation_id,
+            bucket=hour_bucket(execution.finished_at),
+            status=execution.status,
+            defaults={"histogram": [0] * (len(ROLLUP_DURATION_BUCKETS_MS) + 1)},
+        )
+        histogram = rollup.histogram or [0] * (len(ROLLUP_DURATION_BUCKETS_MS) + 1)
+        histogram[histogram_index(duration_ms)] += 1
+
+        rollup.count += 1
+        rollup.duration_ms_sum += duration_ms
+        rollup.histogram = histogram
+        rollup.save(update_fields=["count", "duration_ms_sum", "histogram", "updated_at"])
+
+    return True
+
+
+def rollup_pending_executions(limit=None) -> int:
+    """Record finished executions the task runner did not get to."""
+    limit = limit or settings.EXECUTION_ROLLUP_BATCH_SIZE
+    executions = Execution.objects.filter(
+        rolled_up_at__isnull=True,
+        status__in=TERMINAL_STATUSES,
+        finished_at__isnull=False,
+    ).only(
+        "id", "automation_id", "status", "started_at", "finished_at", "created_at"
+    ).order_by("finished_at")[:limit]
+
+    recorded = 0
+    for execution in executions:
+        if record_execution(execution):
+            recorded += 1
+    return recorded
+
+
+def histogram_percentile(histogram, total, percentile):
+    """
+    Upper bound (ms) of the bucket holding the given percentile. The
+    overflow bucket has no upper bound, so a percentile landing there is
+    reported as ">{last bound}" instead of an understated number.
+    """
+    if not total:
+        return None
+
+    threshold = total * percentile
+    running = 0
+    for index, count in enumerate(histogram):
+        running += count
+        if running >= threshold:
+            break
+    if index < len(ROLLUP_DURATION_BUCKETS_MS):
+        return ROLLUP_DURATION_BUCKETS_MS[index]
+    return f">{ROLLUP_DURATION_BUCKETS_MS[-1]}"
+
+
+def summarize_rollups(queryset, since, until) -> dict:
+    """
+    Merge rollup rows into totals, duration percentiles and an hourly
+    series. Work depends on the window size, not on execution history.
+    """
+    rows = queryset.filter(
+        bucket__gte=hour_bucket(since),
+        bucket__lt=until,
+    ).values("bucket", "status", "count", "duration_ms_sum", "histogram").order_by("bucket")
+
+    by_status = {value: 0 for value in TERMINAL_STATUSES}
+    histogram = [0] * (len(ROLLUP_DURATION_BUCKETS_MS) + 1)
+    series = {}
+    total = 0
+    duration_ms_sum = 0
+
+    for row in rows:
+        total += row["count"]
+        duration_ms_sum += row["duration_ms_sum"]
+        by_status[row["status"]] = by_status.get(row["status"], 0) + row["count"]
+        for index, count in enumerate(row["histogram"] or []):
+            histogram[index] += count
+
+        point = series.setdefault(row["bucket"], {"bucket": row["bucket"], "total": 0})
+        point[row["status"]] = point.get(row["status"], 0) + row["count"]
+        point["total"] += row["count"]
+
+    return {
+        "since": since,
+        "until": until,
+        "total": total,
+        "by_status": by_status,
+        "duration_ms": {
+            "avg": round(duration_ms_sum / total) if total else None,
+            "p50": histogram_percentile(histogram, total, 0.5),
+            "p95": histogram_percentile(histogram, total, 0.95),
+            "p99": histogram_percentile(histogram, total, 0.99),
+        },
+        "histogram": {
+            "bounds_ms": ROLLUP_DURATION_BUCKETS_MS,
+            "counts": histogram,
+        },
+        "series": list(series.values()),
+    }
+
+
+def stats_window(query_params):
+    """
+    Parse `since`/`until` query params, defaulting to the last
+    EXECUTION_STATS_DEFAULT_HOURS hours. Raises ValueError on bad input.
+    """
+    until = timezone.now()
+    since = until - timedelta(hours=settings.EXECUTION_STATS_DEFAULT_HOURS)
+
+    for name in ("since", "until"):
+        raw = query_params.get(name)
+        if not raw:
+            continue
+        value = parse_datetime(raw)
+        if value is None:
+            raise ValueError(f"Invalid '{name}' datetime.")
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        if name == "since":
+            since = value
+        else:
+            until = value
+
+    if since >= until:
+        raise ValueError("'since' must be before 'until'.")
+
+    return since, until
@@ -0,0 +1,241 @@
+import orjson
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
+
+from automations.models import Automation, Connection, Integration, Step, Trigger
+
+
+EXPORT_VERSION = 1
+
+# Errors kept in an import report; the counts stay exact beyond this
+MAX_REPORTED_ERRORS = 100
+
+
+def connection_ref(connection):
+    # Enough to find the matching connection elsewhere; never the secrets
+    if connection is None:
+        return None
+    return {
+        "id": str(connection.id),
+        "integration": connection.integration_id,
+        "display_name": connection.display_name,
+    }
+
+
+def export_record(automation) -> dict:
+    trigger = getattr(automation, "trigger", None)
+    return {
+        "version": EXPORT_VERSION,
+        "id": str(automation.id),
+        "name": automation.name,
+        "description": automation.description,
+        "settings": automation.settings,
+        "trigger": {
+            "type": trigger.type,
+            "trigger_key": trigger.trigger_key,
+            "integration": trigger.integration_id,
+            "connection": connection_ref(trigger.connection),
+            "config": trigger.config,
+        } if trigger else None,
+        "steps": [
+            {
+                "kind": step.kind,
+                "order": step.order,
+                "integration": step.integration_id,
+                "connection": connection_ref(step.connection),
+                "action_name": step.action_name,
+                "config": step.config,
+            }
+            for step in automation.steps.all()
+        ],
+    }
+
+
+def iter_export_lines(workspace, chunk_size=None):
+    """
+    Yield one NDJSON line (bytes) per automation in the workspace.
+
+    Rows come from a server-side cursor in chunks, with triggers joined and
+    steps prefetched per chunk, so memory stays flat for any workspace size.
+    """
+    chunk_size = chunk_size or settings.AUTOMATION_EXPORT_CHUNK_SIZE
+    automations = Automation.objects.filter(
+        workspace=workspace
+    ).select_related(
+        "trigger__connection"
+    ).prefetch_related(
+        Prefetch("steps", queryset=Step.objects.select_related("connection").order_by("order"))
+    ).order_by("created_at", "id")
+
+    for automation in automations.iterator(chunk_size=chunk_size):
+        yield orjson.dumps(export_record(automation)) + b"\n"
+
+
+class ConnectionResolver:
+    """
+    Maps exported connection references onto the target workspace: an
+    explicit old -> new ID mapping first, then the same ID if it already
+    lives in the workspace, then a connection with the same integration and
+    display name. Unresolved references import as no connection.
+    """
+
+    def __init__(self, workspace, mapping=None):
+        self.mapping = {str(old): str(new) for old, new in (mapping or {}).items()}
+        self.by_id = {}
+        self.by_name = {}
+        for connection in Connection.objects.filter(workspace=workspace).only("id", "integration_id", "display_name"):
+            self.by_id[str(connection.id)] = connection.id
+            self.by_name.setdefault((connection.integration_id, connection.display_name), connection.id)
+
+    def resolve(self, ref):
+        if not ref:
+            return None
+        mapped = self.mapping.get(ref.get("id"))
+        if mapped in self.by_id:
+            return self.by_id[mapped]
+        if ref.get("id") in self.by_id:
+            return self.by_id[ref["id"]]
+        return self.by_name.get((ref.get("integration"), ref.get("display_name")))
+
+
+def validate_record(record, integration_ids) -> list[str]:
+    if not isinstance(record, dict):
+        return ["Line is not a JSON object."]
+
+    errors = []
+    if record.get("version") != EXPORT_VERSION:
+        errors.append(f"Unsupported export version {record.get('version')!r}.")
+    if not isinstance(record.get("name"), str) or not record["name"].strip():
+        errors.append("Automation name is required.")
+
+    trigger = record.get("trigger")
+    if trigger is not None:
+        if not isinstance(trigger, dict):
+            errors.append("Trigger must be an object.")
+        else:
+            if trigger.get("type") not in Trigger.Type.values:
+                errors.append(f"Unknown trigger type {trigger.get('type')!r}.")
+            if trigger.get("integration") not in integration_ids:
+                errors.append(f"Unknown trigger integration {trigger.get('integration')!r}.")
+            if not trigger.get("trigger_key"):
+                errors.append("Trigger key is required.")
+
+    steps = record.get("steps") or []
+    if not isinstance(steps, list):
+        return errors + ["Steps must be a list."]
+
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict):
+            errors.append(f"Step {index}: must be an object.")
+            continue
+        if step.get("kind", Step.Kind.ACTION) not in Step.Kind.values:
+            errors.append(f"Step {index}: unknown kind {step.get('kind')!r}.")
+        if step.get("integration") is not None and step["integration"] not in integration_ids:
+            errors.append(f"Step {index}: unknown integration {step['integration']!r}.")
+
+    return errors
+
+
+def build_objects(record, *, workspace, owner, connections):
+    automation = Automation(
+        workspace=workspace,
+        owner=owner,
+        name=record["name"],
+        description=record.get("description"),
+        settings=record.get("settings") or {},
+        status=Automation.Status.DRAFT,
+    )
+
+    trigger = None
+    if record.get("trigger"):
+        data = record["trigger"]
+        trigger = Trigger(
+            automation=automation,
+            type=data["type"],
+            trigger_key=data["trigger_key"],
+            integration_id=data["integration"],
+            connection_id=connections.resolve(data.get("connection")),
+            config=data.get("config") or {},
+            status=Trigger.Status.DRAFT,
+        )
+
+    # Orders are renumbered so gaps or duplicates in the file cannot clash
+    steps = sorted(record.get("steps") or [], key=lambda step: step.get("order") or 0)
+    step_objects = [
+        Step(
+            automation=automation,
+            kind=data.get("kind", Step.Kind.ACTION),
+            order=position,
+            integration_id=data.get("integration"),
+            connection_id=connections.resolve(data.get("connection")),
+            action_name=data.get("action_name"),
+            config=data.get("config") or {},
+            status=Step.Status.DRAFT,
+        )
+        for position, data in enumerate(steps, start=1)
+    ]
+    return automation, trigger, step_objects
+
+
+def import_automations(lines, *, workspace, owner, connection_map=None, batch_size=None) -> dict:
+    """
+    Import NDJSON automations (as produced by iter_export_lines) into the
+    workspace as drafts.
+
+    Lines are validated and written in batches, each batch with one
+    bulk_create per model inside its own transaction, so neither the input
+    nor the created rows are ever held in full. Invalid lines are skipped
+    and reported by line number.
+    """
+    batch_size = batch_size or settings.AUTOMATION_IMPORT_BATCH_SIZE
+    integration_ids = set(Integration.objects.values_list("id", flat=True))
+    connections = ConnectionResolver(workspace, connection_map)
+
+    report = {"imported": 0, "skipped": 0, "errors": []}
+    batch = []
+
+    def flush():
+        automations, triggers, steps = [], [], []
+        for record in batch:
+            automation, trigger, step_objects = build_objects(
+                record, workspace=workspace, owner=owner, connections=connections
+            )
+            automations.append(automation)
+            if trigger:
+                triggers.append(trigger)
+            steps.extend(step_objects)
+
+        with transaction.atomic():
+            Automation.objects.bulk_create(automations)
+            Trigger.objects.bulk_create(triggers)
+            Step.objects.bulk_create(steps)
+
+        report["imported"] += len(automations)
+        batch.clear()
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            errors = [f"Invalid JSON: {e}"]
+        else:
+            errors = validate_record(record, integration_ids)
+
+        if errors:
+            report["skipped"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append({"line": line_number, "errors": errors})
+            continue
+
+        batch.append(record)
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    return report
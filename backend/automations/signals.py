@@ -0,0 +1,42 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from automations.models import Integration, Workspace, WorkspaceMembership
+from automations.services.memberships import invalidate_workspace_roles
+
+
+@receiver([post_save, post_delete], sender=Integration)
+def clear_integration_catalog(sender, **kwargs):
+    # Imported lazily: the catalog pulls in the integration registry, which
+    # must not load before the integrations app is ready.
+    from automations.services.catalog import catalog
+
+    catalog.clear()
+
+
+def clear_roles_on_commit(user_ids):
+    # Cleared only once the change is visible; clearing inside the transaction
+    # lets a concurrent request re-cache the old roles before the commit.
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: invalidate_workspace_roles(*user_ids))
+
+
+@receiver([post_save, post_delete], sender=WorkspaceMembership)
+def clear_membership_roles(sender, instance, **kwargs):
+    clear_roles_on_commit([instance.user_id])
+
+
+@receiver(m2m_changed, sender=Workspace.members.through)
+def clear_member_set_roles(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        # instance is the user
+        clear_roles_on_commit([instance.pk])
+    elif action == "pre_clear":
+        clear_roles_on_commit(instance.members.values_list("pk", flat=True))
+    else:
+        clear_roles_on_commit(pk_set or [])
@@ -2,6 +2,9 @@ from celery import shared_task
 from requests.exceptions import Timeout
 
 from automations.models import Automation, EventRecord, Step, Execution, Task
+from automations.services.execution_events import publish_execution, publish_task
+from automations.services.rollups import record_execution, rollup_pending_executions
+from core.metrics import incr_metric
 
 from django.utils import timezone
 from django.db import transaction
@@ -49,6 +52,8 @@ def run_automation_task(self, event_id, execution_id):
                     "started_at": timezone.now()
                 }
             )
+            if created:
+                publish_task(task)
 
             if task.status == Task.Status.SUCCESS:
                 context["step_results"][str(step.id)] = task.output_payload
@@ -62,12 +67,14 @@ def run_automation_task(self, event_id, execution_id):
                     task.output_payload = result
                     task.finished_at = timezone.now()
                     task.save()
+                publish_task(task)
 
             except Exception as step_error:
                 task.error = str(step_error)
                 task.status = Task.Status.FAILED
                 task.finished_at = timezone.now()
                 task.save()
+                publish_task(task)
                 raise Timeout(str(step_error))
         
         execution.status = Execution.Status.SUCCESS
@@ -82,12 +89,22 @@ def run_automation_task(self, event_id, execution_id):
     finally:
         execution.finished_at = timezone.now()
         execution.save()
+        publish_execution(execution)
+        # Only counts once the execution reached a final status
+        record_execution(execution)
 
 
+@shared_task
+def rollup_executions_task():
+    recorded = rollup_pending_executions()
+    if recorded:
+        incr_metric("rollup.executions", recorded)
+
 
-def execute_step(step, context):
+
+def execute_step(step, context, *, mode="live"):
     if step.kind == Step.Kind.ACTION:
-        return execute_action(step, context)
+        return execute_action(step, context, mode=mode)
 
     if step.kind == Step.Kind.CONDITION:
         return execute_condition(step, context)
@@ -95,11 +112,19 @@ def execute_step(step, context):
     raise ValueError(f"Unknown step kind: {step.kind}")
 
 
-def execute_action(step, context):
-    from integrations.registry import get_integration_service
+def execute_action(step, context, *, mode="live"):
+    from integrations.registry import get_action_catalog, get_integration_service
+    from integrations.schemas import format_config_errors
 
     action_name = step.action_name
     config = step.config 
+    # Same validator as publish; also fills in schema defaults
+    action = get_action_catalog(step.integration_id).get(action_name)
+    if action is not None:
+        config, errors = action.validate(config)
+        if errors:
+            raise ValueError(f"Invalid config for '{action_name}': {'; '.join(format_config_errors(errors))}")
+
     service_cls = get_integration_service(
         step.integration.id,
         connection=step.connection
@@ -111,7 +136,8 @@ def execute_action(step, context):
         action_id=action_name,
         connection=step.connection,
         config=config,
-        context=context
+        context=context,
+        mode=mode
     )
 
     return result
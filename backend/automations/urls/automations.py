@@ -9,10 +9,13 @@ from automations.views.automations import (
     TriggerList,
     TriggerDetail,
     StepList,
+    StepBulk,
     StepDetail,
     ExecutionDetail,
     ExecutionList,
+    AutomationStats,
 )
+from automations.views.streams import execution_stream
 
 urlpatterns = [
     # Automations
@@ -31,9 +34,14 @@ urlpatterns = [
 
     # Steps
     path("<str:pk>/steps/", StepList.as_view(), name="automation-step-list"),
+    path("<str:pk>/steps/bulk/", StepBulk.as_view(), name="automation-step-bulk"),
     path("<str:pk>/steps/<str:step_id>/", StepDetail.as_view(), name="automation-step-detail"),
 
     # Executions
+    path("<str:pk>/executions/<str:execution_id>/stream/", execution_stream, name="automation-execution-stream"),
     path("<str:pk>/executions/<str:execution_id>/", ExecutionDetail.as_view(), name="automation-execution-detail"),
     path("<str:pk>/executions/", ExecutionList.as_view(), name="automation-execution-list"),
+
+    # Stats
+    path("<str:pk>/stats/", AutomationStats.as_view(), name="automation-stats"),
 ]
\ No newline at end of file
@@ -5,6 +5,9 @@ from automations.views.workspace import (
     WorkspaceMemberList,
     WorkspaceMemberDetail,
     WorkspaceAutomationList,
+    WorkspaceAutomationExport,
+    WorkspaceAutomationImport,
+    WorkspaceStats,
     WorkspaceConnectionList,
     WorkspaceConnectionDetail,
     WorkspaceConnectionInitiate,
@@ -19,6 +22,11 @@ urlpatterns = [
 
     # Automations
     path("<str:pk>/automations/", WorkspaceAutomationList.as_view(), name="workspace-automation-list"),
+    path("<str:pk>/automations/export/", WorkspaceAutomationExport.as_view(), name="workspace-automation-export"),
+    path("<str:pk>/automations/import/", WorkspaceAutomationImport.as_view(), name="workspace-automation-import"),
+
+    # Stats
+    path("<str:pk>/stats/", WorkspaceStats.as_view(), name="workspace-stats"),
 
     # Connections
     path("<str:pk>/connections/", WorkspaceConnectionList.as_view(), name="workspace-connection-list"),
@@ -3,18 +3,27 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
 
-from automations.models import Automation, Execution, Step, Trigger, Workspace
+from api.pagination import KeysetPagination
+
+from automations.models import Automation, Execution, ExecutionRollup, Step, Trigger, Workspace
 from automations.serializers import (
     AutomationSerializer,
     TriggerSerializer,
     ExecutionSerializer,
+    ExecutionSummarySerializer,
+    execution_summary_queryset,
+    sparse_context,
     StepCreateSerializer,
     StepDetailSerializer,
     StepUpdateSerializer,
+    StepBulkSerializer,
     PublishAutomationSerializer
 )
-from automations.services.automations import publish_automation
+from automations.services.automations import publish_automation, replace_steps
+from automations.services.memberships import workspace_ids
+from automations.services.rollups import stats_window, summarize_rollups
 from automations.exceptions import AutomationValidationError
 
 
@@ -23,8 +32,8 @@ class AutomationList(APIView):
 
     def get(self, request):
         qs = Automation.objects.filter(
-            workspace__members=request.user
-        ).distinct()
+            workspace_id__in=workspace_ids(request)
+        )
 
         workspace_id = request.query_params.get("workspace_id")
         if workspace_id:
@@ -34,7 +43,12 @@ class AutomationList(APIView):
         if status_param:
             qs = qs.filter(status=status_param)
 
-        return Response(AutomationSerializer(qs, many=True).data)
+        context = sparse_context(request)
+        qs = AutomationSerializer.optimize_queryset(qs, context, required=["created_at"])
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response(AutomationSerializer(page, many=True, context=context).data)
 
     def post(self, request):
         # workspace_id = request.data.get("workspace_id")
@@ -59,15 +73,19 @@ class AutomationDetail(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
+        context = sparse_context(request)
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            AutomationSerializer.optimize_queryset(
+                Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk),
+                context
+            )
         )
-        serializer = AutomationSerializer(automation)
+        serializer = AutomationSerializer(automation, context=context)
         return Response(serializer.data)
 
     def patch(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         serializer = AutomationSerializer(automation, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
@@ -76,7 +94,7 @@ class AutomationDetail(APIView):
 
     def delete(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         automation.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -88,7 +106,7 @@ class AutomationEnable(APIView):
 
     def post(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         automation.status = Automation.Status.ENABLED
         automation.save()
@@ -101,7 +119,7 @@ class AutomationDisable(APIView):
 
     def post(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         automation.status = Automation.Status.DISABLED
         automation.save()
@@ -114,7 +132,7 @@ class AutomationPause(APIView):
 
     def post(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         automation.status = Automation.Status.PAUSED
         automation.save()
@@ -128,7 +146,7 @@ class AutomationPublish(APIView):
         automation = get_object_or_404(
             Automation.objects.prefetch_related('steps', 'trigger'),
             id=pk,
-            workspace__members=request.user
+            workspace_id__in=workspace_ids(request)
         )
 
         serializer = PublishAutomationSerializer(data=request.data, context={'automation': automation})
@@ -150,7 +168,7 @@ class TriggerList(APIView):
 
     def post(self, request, pk):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         serializer = TriggerSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -164,7 +182,7 @@ class TriggerDetail(APIView):
 
     def get(self, request, pk, trigger_id):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         trigger = get_object_or_404(
             Trigger.objects.filter(id=trigger_id, automation=automation)
@@ -175,7 +193,7 @@ class TriggerDetail(APIView):
 
     def patch(self, request, pk, trigger_id):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         trigger = get_object_or_404(
             Trigger.objects.filter(id=trigger_id, automation=automation)
@@ -188,7 +206,7 @@ class TriggerDetail(APIView):
 
     def delete(self, request, pk, trigger_id):
         automation = get_object_or_404(
-            Automation.objects.filter(workspace__members=request.user, pk=pk)
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
         )
         trigger = get_object_or_404(
             Trigger.objects.filter(id=trigger_id, automation=automation)
@@ -206,7 +224,7 @@ class StepList(APIView):
     def get(self, request, pk):
         steps = Step.objects.filter(
             automation_id=pk,
-            automation__workspace__members=request.user,
+            automation__workspace_id__in=workspace_ids(request),
         )
         serializer = StepDetailSerializer(steps, many=True)
         return Response(serializer.data)
@@ -218,6 +236,21 @@ class StepList(APIView):
         return Response(StepDetailSerializer(step).data, status=status.HTTP_201_CREATED)
 
 
+class StepBulk(APIView):
+    """PUT /automations/<pk>/steps/bulk/ — replace the whole ordered step list"""
+    permission_classes = [IsAuthenticated]
+
+    def put(self, request, pk):
+        automation = get_object_or_404(
+            Automation.objects.filter(workspace_id__in=workspace_ids(request), pk=pk)
+        )
+        serializer = StepBulkSerializer(data=request.data, context={"automation": automation})
+        serializer.is_valid(raise_exception=True)
+
+        steps = replace_steps(automation, serializer.validated_data["steps"])
+        return Response(StepDetailSerializer(steps, many=True).data)
+
+
 class StepDetail(APIView):
     """PATCH/DELETE /automations/<pk>/steps/<step_id>/"""
     permission_classes = [IsAuthenticated]
@@ -256,31 +289,78 @@ class StepDetail(APIView):
 # Executions 
 
 class ExecutionDetail(APIView):
+    permission_classes = [IsAuthenticated]
+
     def get(self, request, pk, execution_id):
+        # By default two queries: the execution with its automation and
+        # trigger, then its tasks with their steps.
+        context = sparse_context(request)
+        queryset = ExecutionSerializer.optimize_queryset(Execution.objects.all(), context)
         try:
-            execution = Execution.objects.get(
-                automation__workspace__members=request.user,
+            execution = queryset.get(
+                automation__workspace_id__in=workspace_ids(request),
                 id=execution_id
             )
         except Execution.DoesNotExist:
             return Response({"detail": "Execution not found"}, status=404)
         
-        serializer = ExecutionSerializer(execution)
+        serializer = ExecutionSerializer(execution, context=context)
         return Response(serializer.data)
             
 
 class ExecutionList(APIView):
-    """GET /automations/<pk>/executions/"""
+    """GET /automations/<pk>/executions/?status=&created_after=&created_before=&cursor="""
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
         try:
             automation = get_object_or_404(
-                Automation.objects.filter(workspace__members=request.user),
+                Automation.objects.filter(workspace_id__in=workspace_ids(request)),
                 pk=pk
             )
         except Automation.DoesNotExist:
             return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
-        queryset = Execution.objects.filter(automation=automation).order_by("-created_at")
-        serializer = ExecutionSerializer(queryset, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        queryset = execution_summary_queryset(
+            Execution.objects.filter(automation=automation)
+        )
+
+        status_param = request.query_params.get("status")
+        if status_param:
+            queryset = queryset.filter(status=status_param)
+
+        for param, lookup in (("created_after", "created_at__gte"), ("created_before", "created_at__lt")):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            parsed = parse_datetime(value)
+            if parsed is None:
+                return Response(
+                    {param: "Must be an ISO 8601 datetime."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            queryset = queryset.filter(**{lookup: parsed})
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = ExecutionSummarySerializer(page, many=True, context=sparse_context(request))
+        return paginator.get_paginated_response(serializer.data)
+
+
+class AutomationStats(APIView):
+    """GET /automations/<pk>/stats/?since=&until="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        automation = get_object_or_404(
+            Automation.objects.filter(workspace_id__in=workspace_ids(request)),
+            pk=pk
+        )
+        try:
+            since, until = stats_window(request.query_params)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = summarize_rollups(
+            ExecutionRollup.objects.filter(automation=automation), since, until
+        )
+        return Response(stats)
@@ -1,62 +1,97 @@
-from rest_framework import permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
 from django.shortcuts import redirect
 
 from integrations.services.google_forms import GoogleFormsService
 from automations.models import Integration, Connection, Workspace
-from automations.serializers import IntegrationSerializer, IntegrationThinSerializer
+from automations.services.catalog import (
+    build_action_list,
+    build_integration_detail,
+    build_integration_list,
+    build_trigger_list,
+    catalog,
+    catalog_response,
+    is_known_trigger_type,
+)
+from automations.services.memberships import get_workspace_roles
+from users.authentication import authenticate_async
 
 import requests
 from integrations.registry import get_integration_service, INTEGRATION_REGISTRY
 
 
-@api_view(['GET'])
-@permission_classes([permissions.IsAuthenticated])
-def connection_test(request, connection_id):
-    connection = Connection.objects.get(id=connection_id)
+@sync_to_async
+def get_visible_connection(user, connection_id):
+    try:
+        return Connection.objects.filter(
+            workspace_id__in=list(get_workspace_roles(user)),
+        ).get(id=connection_id)
+    except (Connection.DoesNotExist, ValidationError):
+        return None
+
+
+async def connection_test(request, connection_id):
+    """
+    GET /integrations/test/<connection_id>
+
+    Async so a slow provider holds an event loop slot rather than a worker
+    while the test request is in flight.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    user = await authenticate_async(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided or are invalid."},
+            status=401,
+        )
 
-    service = get_integration_service(connection.integration.id, connection)
-    if service.test_connection():
-        return Response({'status': 'Up and running!'})
-    
-    return Response({'status': 'Error. Connection not working!'}, status=400)
+    connection = await get_visible_connection(user, connection_id)
+    if connection is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    service = get_integration_service(connection.integration_id, connection)
+    if await service.atest_connection():
+        return JsonResponse({'status': 'Up and running!'})
+
+    return JsonResponse({'status': 'Error. Connection not working!'}, status=400)
 
 
 @api_view(['GET'])
 def integration_detail(request, integration_id):
-    integration = Integration.objects.get(id=integration_id)
-    serializer = IntegrationSerializer(integration)
-    return Response(serializer.data)
+    entry = catalog.get(
+        ("detail", integration_id),
+        lambda: build_integration_detail(integration_id),
+    )
+    return catalog_response(request, entry)
 
 
 @api_view(['GET'])
 def integration_list(request):
-    integrations = Integration.objects.all()
-    serializer = IntegrationThinSerializer(integrations, many=True)
-    return Response(serializer.data)
+    entry = catalog.get(("list",), build_integration_list)
+    return catalog_response(request, entry)
 
 
 @api_view(['GET'])
 def trigger_list(request, integration_id):
     trigger_type = request.query_params.get("type", None)
-
-    service_cls = INTEGRATION_REGISTRY[integration_id]
-    triggers = service_cls.as_dict()["triggers"]
-
-    if trigger_type:
-        triggers = {
-            key: value
-            for key, value in triggers.items()
-            if value.get("type") == trigger_type
-        }
-
-    return Response(triggers)
+    entry = catalog.get(
+        ("triggers", integration_id, trigger_type),
+        lambda: build_trigger_list(integration_id, trigger_type),
+        store=is_known_trigger_type(trigger_type),
+    )
+    return catalog_response(request, entry)
 
 
 @api_view(['GET'])
 def action_list(request, integration_id):
-    service_cls = INTEGRATION_REGISTRY[integration_id]
-    actions = service_cls.as_dict()["actions"]
-    return Response(actions)
\ No newline at end of file
+    entry = catalog.get(
+        ("actions", integration_id),
+        lambda: build_action_list(integration_id),
+    )
+    return catalog_response(request, entry)
@@ -1,5 +1,6 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.utils import timezone
 
@@ -42,10 +43,15 @@ def start_oauth(request, integration_id, workspace_id):
     return redirect(auth_url)
 
 
-@api_view(["GET"])
-def oauth_complete(request, service_name):
-    code = request.query_params.get("code")
-    state = request.query_params.get('state') # connection ID
+async def oauth_complete(request, service_name):
+    """
+    GET /integrations/oauth/<service_name>/callback/
+
+    Async: the code exchange and the connection test are calls to the
+    provider, made on the async client instead of holding a worker.
+    """
+    code = request.GET.get("code")
+    state = request.GET.get('state') # connection ID
     connection = None
     from_source = None
     automation_id = None
@@ -57,32 +63,35 @@ def oauth_complete(request, service_name):
             connection_id = decoded_state.get("connection_id")
             from_source = decoded_state.get("from")
             automation_id = decoded_state.get("automation_id")
-            connection = Connection.objects.get(id=connection_id)
+            connection = await Connection.objects.aget(id=connection_id)
 
         except Exception as e:
-            return Response({"error": "Failed to decode state"})
-    
-    service = get_integration_service(connection.integration.id, connection)
-    new_secrets = service.connect(
+            return JsonResponse({"error": "Failed to decode state"})
+
+    if connection is None:
+        return JsonResponse({"error": "Failed to decode state"})
+
+    service = get_integration_service(connection.integration_id, connection)
+    new_secrets = await service.aconnect(
         config=connection.config,
         secrets={"authorization_code": code}
     )
     if new_secrets:
         connection.secrets = new_secrets
-        connection.save(update_fields=["secrets"])
+        await connection.asave(update_fields=["secrets"])
 
-    if not service.test_connection():
+    if not await service.atest_connection():
         connection.status = Connection.Status.DISABLED
         connection.last_tested = timezone.now()
-        connection.save(update_fields=["status", "last_tested"])
-        return Response(
+        await connection.asave(update_fields=["status", "last_tested"])
+        return JsonResponse(
             {"error": "Connection test failed"},
             status=400
         )
     
     connection.status = Connection.Status.ACTIVE
     connection.last_tested = timezone.now()
-    connection.save(update_fields=["status", "last_tested"])
+    await connection.asave(update_fields=["status", "last_tested"])
 
     if from_source == "automation":
         return redirect(
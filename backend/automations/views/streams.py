@@ -0,0 +1,112 @@
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse, StreamingHttpResponse
+
+from automations.models import Execution, Task
+from users.authentication import authenticate_async
+from automations.services.memberships import get_workspace_roles
+from automations.services.execution_events import (
+    encode_event,
+    execution_channel,
+    execution_state,
+    get_async_redis,
+    is_finished,
+    task_state,
+)
+
+
+def visible_executions(user, pk):
+    return Execution.objects.filter(
+        automation_id=pk,
+        automation__workspace_id__in=list(get_workspace_roles(user)),
+    )
+
+
+@sync_to_async
+def execution_exists(user, pk, execution_id):
+    try:
+        return visible_executions(user, pk).filter(id=execution_id).exists()
+    except ValidationError:
+        return False
+
+
+@sync_to_async
+def load_snapshot(user, pk, execution_id):
+    execution = visible_executions(user, pk).get(id=execution_id)
+    tasks = Task.objects.filter(execution=execution).order_by("created_at")
+    return {
+        "execution": execution_state(execution),
+        "tasks": [task_state(task) for task in tasks],
+    }
+
+
+def sse(event_type, payload) -> str:
+    return f"event: {event_type}\ndata: {payload}\n\n"
+
+
+async def stream_execution_events(user, pk, execution_id):
+    client = get_async_redis()
+    pubsub = client.pubsub()
+    try:
+        # Subscribe before taking the snapshot so no transition falls between them
+        await pubsub.subscribe(execution_channel(execution_id))
+        snapshot = await load_snapshot(user, pk, execution_id)
+        yield sse("snapshot", encode_event("snapshot", snapshot))
+        if is_finished(snapshot["execution"]["status"]):
+            return
+
+        deadline = time.monotonic() + settings.EXECUTION_STREAM_MAX_DURATION
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.EXECUTION_STREAM_HEARTBEAT,
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            payload = message["data"].decode()
+            event = json.loads(payload)
+            yield sse(event["type"], payload)
+
+            if event["type"] == "execution" and is_finished(event["data"]["status"]):
+                return
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+
+
+async def execution_stream(request, pk, execution_id):
+    """
+    GET /automations/<pk>/executions/<execution_id>/stream/
+
+    Server-sent events for a single execution: a `snapshot` of the
+    execution and its tasks, then `task` and `execution` transitions as
+    run_automation_task publishes them. The stream ends once the execution
+    finishes. Needs the ASGI server (core.asgi) to hold connections open
+    without tying up a worker thread.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    user = await authenticate_async(request, allow_query_token=True)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided or are invalid."},
+            status=401,
+        )
+
+    if not await execution_exists(user, pk, execution_id):
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    response = StreamingHttpResponse(
+        stream_execution_events(user, pk, execution_id),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
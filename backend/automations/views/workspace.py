@@ -5,10 +5,16 @@ from rest_framework import status
 
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.contrib.auth import get_user_model
 
-from automations.models import Workspace, WorkspaceMembership, Automation, Connection, Integration
-from automations.serializers import WorkspaceSerializer, WorkspaceMembershipSerializer, AutomationSerializer, ConnectionSerializer, ConnectionDisplaySerializer
+from api.pagination import KeysetPagination
+
+from automations.models import Workspace, WorkspaceMembership, Automation, Connection, ExecutionRollup, Integration
+from automations.services.memberships import workspace_ids, workspace_role
+from automations.services.rollups import stats_window, summarize_rollups
+from automations.services.transfer import iter_export_lines, import_automations
+from automations.serializers import WorkspaceSerializer, WorkspaceMembershipSerializer, AutomationSerializer, ConnectionSerializer, ConnectionDisplaySerializer, sparse_context
 
 User = get_user_model()
 
@@ -18,8 +24,11 @@ class WorkspaceList(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        workspaces = Workspace.objects.filter(members=request.user).distinct()
-        serializer = WorkspaceSerializer(workspaces, many=True)
+        context = sparse_context(request)
+        workspaces = WorkspaceSerializer.optimize_queryset(
+            Workspace.objects.filter(id__in=workspace_ids(request)), context
+        )
+        serializer = WorkspaceSerializer(workspaces, many=True, context=context)
         return Response(serializer.data)
 
     def post(self, request):
@@ -34,11 +43,12 @@ class SetActiveWorkspace(APIView):
         user = request.user
         workspace_id = request.data.get('workspaceId')
         workspace = Workspace.objects.get(
-            members=user,
+            id__in=workspace_ids(request),
             id=workspace_id
         )
         user.active_workspace = workspace
-        user.save()
+        # request.user is built from the auth snapshot; write only this field
+        user.save(update_fields=["active_workspace"])
         return Response({
             "message": "Active workspace updated",
             "workspace": WorkspaceSerializer(workspace).data
@@ -50,13 +60,19 @@ class WorkspaceDetail(APIView):
 
     def get_object(self, request, pk):
         return get_object_or_404(
-            Workspace.objects.filter(members=request.user).distinct(),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk,
         )
 
     def get(self, request, pk):
-        workspace = self.get_object(request, pk)
-        serializer = WorkspaceSerializer(workspace)
+        context = sparse_context(request)
+        workspace = get_object_or_404(
+            WorkspaceSerializer.optimize_queryset(
+                Workspace.objects.filter(id__in=workspace_ids(request)), context
+            ),
+            pk=pk,
+        )
+        serializer = WorkspaceSerializer(workspace, context=context)
         return Response(serializer.data)
 
     def patch(self, request, pk):
@@ -79,17 +95,20 @@ class WorkspaceMemberList(APIView):
     @transaction.atomic
     def get(self, request, pk):
         workspace = get_object_or_404(
-            Workspace.objects.filter(members=request.user).distinct(),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk,
         )
-        memberships = WorkspaceMembership.objects.filter(workspace=workspace)
-        serializer = WorkspaceMembershipSerializer(memberships, many=True)
+        context = sparse_context(request)
+        memberships = WorkspaceMembershipSerializer.optimize_queryset(
+            WorkspaceMembership.objects.filter(workspace=workspace), context
+        )
+        serializer = WorkspaceMembershipSerializer(memberships, many=True, context=context)
         return Response(serializer.data)
 
     @transaction.atomic
     def post(self, request, pk):
         workspace = get_object_or_404(
-            Workspace.objects.filter(members=request.user).distinct(),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk,
         )
 
@@ -116,17 +135,14 @@ class WorkspaceMemberDetail(APIView):
 
     def get_workspace(self, request, pk):
         return get_object_or_404(
-            Workspace.objects.filter(members=request.user).distinct(),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk,
         )
 
     def patch(self, request, pk, user_id):
         workspace = self.get_workspace(request, pk)
 
-        requester = WorkspaceMembership.objects.filter(
-            workspace=workspace, user=request.user
-        ).first()
-        if not requester or requester.role != WorkspaceMembership.Role.ADMIN:
+        if workspace_role(request, workspace.id) != WorkspaceMembership.Role.ADMIN:
             return Response(
                 {"detail": "Only admins can update roles."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -145,16 +161,14 @@ class WorkspaceMemberDetail(APIView):
     def delete(self, request, pk, user_id):
         workspace = self.get_workspace(request, pk)
 
-        requester = WorkspaceMembership.objects.filter(
-            workspace=workspace, user=request.user
-        ).first()
-        if not requester:
+        requester_role = workspace_role(request, workspace.id)
+        if not requester_role:
             return Response(
                 {"detail": "You're not part of this workspace."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        if requester.role != WorkspaceMembership.Role.ADMIN and str(request.user.id) != str(user_id):
+        if requester_role != WorkspaceMembership.Role.ADMIN and str(request.user.id) != str(user_id):
             return Response(
                 {"detail": "You can only remove yourself."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -168,22 +182,95 @@ class WorkspaceMemberDetail(APIView):
 class WorkspaceAutomationList(APIView):
     def get(self, request, pk):
         workspace = get_object_or_404(
-            Workspace.objects.filter(members=request.user),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk
         )
-        automations = Automation.objects.filter(
-            workspace=workspace
+        context = sparse_context(request)
+        automations = AutomationSerializer.optimize_queryset(
+            Automation.objects.filter(workspace=workspace), context, required=["created_at"]
         )
 
-        serializer = AutomationSerializer(automations, many=True)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(automations, request, view=self)
+        serializer = AutomationSerializer(page, many=True, context=context)
 
-        return Response(serializer.data)
+        return paginator.get_paginated_response(serializer.data)
     
 
+class WorkspaceAutomationExport(APIView):
+    """GET /workspaces/<pk>/automations/export/ (NDJSON, one automation per line)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        workspace = get_object_or_404(
+            Workspace.objects.filter(id__in=workspace_ids(request)),
+            pk=pk
+        )
+        response = StreamingHttpResponse(
+            iter_export_lines(workspace), content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = f'attachment; filename="automations-{workspace.id}.ndjson"'
+        return response
+
+
+class WorkspaceAutomationImport(APIView):
+    """
+    POST /workspaces/<pk>/automations/import/?connection=<old_id>:<new_id>
+
+    The body is NDJSON as produced by the export and is read line by line.
+    Automations are created as drafts; see services.transfer for how
+    connections are matched.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        workspace = get_object_or_404(
+            Workspace.objects.filter(id__in=workspace_ids(request)),
+            pk=pk
+        )
+
+        connection_map = {}
+        for pair in request.query_params.getlist("connection"):
+            old_id, sep, new_id = pair.partition(":")
+            if not sep or not old_id or not new_id:
+                return Response(
+                    {"detail": f"Invalid connection mapping {pair!r}, expected <old_id>:<new_id>."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            connection_map[old_id] = new_id
+
+        # request.stream is None for an empty body
+        lines = request.stream or []
+        report = import_automations(
+            lines, workspace=workspace, owner=request.user, connection_map=connection_map
+        )
+        return Response(report, status=status.HTTP_201_CREATED if report["imported"] else status.HTTP_200_OK)
+
+
+class WorkspaceStats(APIView):
+    """GET /workspaces/<pk>/stats/?since=&until="""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        workspace = get_object_or_404(
+            Workspace.objects.filter(id__in=workspace_ids(request)),
+            pk=pk
+        )
+        try:
+            since, until = stats_window(request.query_params)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = summarize_rollups(
+            ExecutionRollup.objects.filter(automation__workspace=workspace), since, until
+        )
+        return Response(stats)
+
+
 class WorkspaceConnectionList(APIView):
     def get(self, request, pk):
         workspace = get_object_or_404(
-            Workspace.objects.filter(members=request.user),
+            Workspace.objects.filter(id__in=workspace_ids(request)),
             pk=pk
         )
         qs = Connection.objects.filter(
@@ -211,7 +298,7 @@ class WorkspaceConnectionDetail(APIView):
         connection = get_object_or_404(
             Connection.objects.filter(
                 workspace_id=pk,
-                workspace__members=request.user,
+                workspace_id__in=workspace_ids(request),
                 id=connection_id
             )
         )
@@ -222,7 +309,7 @@ class WorkspaceConnectionDetail(APIView):
         connection = get_object_or_404(
             Connection.objects.filter(
                 workspace_id=pk,
-                workspace__members=request.user,
+                workspace_id__in=workspace_ids(request),
                 id=connection_id
             )
         )
@@ -233,7 +320,7 @@ class WorkspaceConnectionDetail(APIView):
         connection = get_object_or_404(
             Connection.objects.filter(
                 workspace_id=pk,
-                workspace__members=request.user,
+                workspace_id__in=workspace_ids(request),
                 id=connection_id
             )
         )
@@ -2,6 +2,10 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve the app through it (e.g. uvicorn core.asgi:application) so that async
+views hold connections open without occupying a worker thread each: the
+execution event stream, and the endpoints that wait on providers (OAuth
+callback, connection and trigger tests).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -22,8 +22,14 @@ task_max_retries = 5
 
 # Beat schedule
 beat_schedule = {
-    "poll-triggers-every-minute": {
+    # Only enqueues triggers whose next_poll_at is due, so ticking often is cheap
+    "poll-due-triggers": {
         "task": 'triggers.tasks.poll_triggers_task',
-        "schedule": 30.0
+        "schedule": 10.0
+    },
+    # Backfills rollups for executions that finished outside run_automation_task
+    "rollup-executions": {
+        "task": "automations.tasks.rollup_executions_task",
+        "schedule": 300.0
     }
 }
\ No newline at end of file
@@ -0,0 +1,29 @@
+from django.core.cache import cache
+
+
+# Delete KEYS[1] only while it still holds ARGV[1], as one atomic step
+_COMPARE_AND_DELETE = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def release_lock(key, token) -> bool:
+    """
+    Delete a cache lock only if it still holds `token`.
+
+    A plain get-then-delete can remove a lock that expired and was taken by
+    another worker in between. On Redis the check and the delete run as one
+    Lua script; other backends (tests, local dev) fall back to the two steps.
+    """
+    backend = getattr(cache, "_cache", None)
+    if backend is None or not hasattr(backend, "get_client"):
+        if cache.get(key) == token:
+            return cache.delete(key)
+        return False
+
+    redis_key = cache.make_and_validate_key(key)
+    client = backend.get_client(redis_key, write=True)
+    return bool(client.eval(_COMPARE_AND_DELETE, 1, redis_key, backend._serializer.dumps(token)))
@@ -0,0 +1,13 @@
+from django.core.cache import cache
+
+
+def incr_metric(name, amount=1):
+    """Bump a named counter kept in the shared cache."""
+    key = f"metrics:{name}"
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, amount, timeout=None)
+        return amount
@@ -43,6 +43,7 @@ CORS_ALLOW_CREDENTIALS = True
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -85,6 +86,17 @@ DATABASES = {
 }
 
 
+# Cache
+# Shared between web and worker processes; leases and locks rely on it.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_CACHE_URL', 'redis://localhost:6379/1'),
+    }
+}
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -132,11 +144,90 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.BasicAuthentication",
     ),
+    # orjson-backed JSON; swap back to rest_framework.renderers.JSONRenderer /
+    # rest_framework.parsers.JSONParser to use the stdlib encoder.
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# Response compression (see api.middleware.CompressionMiddleware). Brotli is
+# used when the optional brotli package is installed.
+API_COMPRESSION_MIN_SIZE = int(os.getenv("API_COMPRESSION_MIN_SIZE", 1024))
+API_COMPRESSION_GZIP_LEVEL = int(os.getenv("API_COMPRESSION_GZIP_LEVEL", 6))
+API_COMPRESSION_BROTLI_QUALITY = int(os.getenv("API_COMPRESSION_BROTLI_QUALITY", 5))
+
+# Trigger polling
+# Poll intervals (seconds) adapt between these bounds: they grow by the
+# backoff factor after empty polls and halve when events arrive.
+TRIGGER_POLL_MIN_INTERVAL = int(os.getenv("TRIGGER_POLL_MIN_INTERVAL", 30))
+TRIGGER_POLL_MAX_INTERVAL = int(os.getenv("TRIGGER_POLL_MAX_INTERVAL", 900))
+TRIGGER_POLL_BACKOFF = float(os.getenv("TRIGGER_POLL_BACKOFF", 1.5))
+# Events persisted per transaction while a poll streams in
+TRIGGER_EVENT_BATCH_SIZE = int(os.getenv("TRIGGER_EVENT_BATCH_SIZE", 100))
+# Source IDs kept at the high-water mark for tie-breaking
+TRIGGER_CURSOR_RECENT_IDS = int(os.getenv("TRIGGER_CURSOR_RECENT_IDS", 500))
+# Seconds a poll lease lives without renewal
+TRIGGER_POLL_LEASE_TTL = int(os.getenv("TRIGGER_POLL_LEASE_TTL", 120))
+
+# Outbound integration HTTP (pooled sessions, see integrations.http)
+INTEGRATION_HTTP_CONNECT_TIMEOUT = float(os.getenv("INTEGRATION_HTTP_CONNECT_TIMEOUT", 5))
+INTEGRATION_HTTP_READ_TIMEOUT = float(os.getenv("INTEGRATION_HTTP_READ_TIMEOUT", 30))
+INTEGRATION_HTTP_POOL_CONNECTIONS = int(os.getenv("INTEGRATION_HTTP_POOL_CONNECTIONS", 10))
+INTEGRATION_HTTP_POOL_MAXSIZE = int(os.getenv("INTEGRATION_HTTP_POOL_MAXSIZE", 20))
+INTEGRATION_HTTP_RETRIES = int(os.getenv("INTEGRATION_HTTP_RETRIES", 3))
+# Google API transports kept per thread (see integrations.transports)
+GOOGLE_TRANSPORT_POOL_SIZE = int(os.getenv("GOOGLE_TRANSPORT_POOL_SIZE", 64))
+
+# OAuth access tokens (see integrations.credentials)
+# Refresh this many seconds before expiry; wait at most OAUTH_REFRESH_WAIT
+# seconds for another worker's refresh.
+OAUTH_REFRESH_SKEW = int(os.getenv("OAUTH_REFRESH_SKEW", 300))
+OAUTH_REFRESH_LOCK_TIMEOUT = int(os.getenv("OAUTH_REFRESH_LOCK_TIMEOUT", 30))
+OAUTH_REFRESH_WAIT = int(os.getenv("OAUTH_REFRESH_WAIT", 10))
+
+# Execution rollups (see automations.services.rollups)
+# Finished executions folded in per batch by the periodic rollup task
+EXECUTION_ROLLUP_BATCH_SIZE = int(os.getenv("EXECUTION_ROLLUP_BATCH_SIZE", 500))
+# Default stats window in hours
+EXECUTION_STATS_DEFAULT_HOURS = int(os.getenv("EXECUTION_STATS_DEFAULT_HOURS", 24))
+
+# Automation export/import (see automations.services.transfer)
+# Automations read per database round trip while exporting
+AUTOMATION_EXPORT_CHUNK_SIZE = int(os.getenv("AUTOMATION_EXPORT_CHUNK_SIZE", 200))
+# Automations validated and written per bulk insert while importing
+AUTOMATION_IMPORT_BATCH_SIZE = int(os.getenv("AUTOMATION_IMPORT_BATCH_SIZE", 200))
+
+# Live execution streams (see automations.services.execution_events)
+# Redis used for pub/sub between workers and the ASGI server
+EXECUTION_EVENTS_REDIS_URL = os.getenv("EXECUTION_EVENTS_REDIS_URL", "redis://localhost:6379/2")
+# Seconds between SSE keepalive comments, and the longest a stream stays open
+EXECUTION_STREAM_HEARTBEAT = int(os.getenv("EXECUTION_STREAM_HEARTBEAT", 15))
+EXECUTION_STREAM_MAX_DURATION = int(os.getenv("EXECUTION_STREAM_MAX_DURATION", 900))
+
+# Browser cache lifetime (seconds) for integration catalog responses; they
+# revalidate with ETags afterwards.
+INTEGRATION_CATALOG_MAX_AGE = int(os.getenv("INTEGRATION_CATALOG_MAX_AGE", 300))
+
+# Seconds a user's workspace IDs and roles stay cached (see
+# automations.services.memberships); membership changes invalidate sooner.
+WORKSPACE_MEMBERSHIP_CACHE_TTL = int(os.getenv("WORKSPACE_MEMBERSHIP_CACHE_TTL", 60))
+
+# Authenticated user snapshots (see users.authentication). The shared cache
+# copy is invalidated on save; per-process copies expire after the local TTL.
+USER_SNAPSHOT_CACHE_TTL = int(os.getenv("USER_SNAPSHOT_CACHE_TTL", 300))
+USER_SNAPSHOT_LOCAL_TTL = int(os.getenv("USER_SNAPSHOT_LOCAL_TTL", 30))
+USER_SNAPSHOT_LOCAL_SIZE = int(os.getenv("USER_SNAPSHOT_LOCAL_SIZE", 10000))
+
 GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 GOOGLE_REDIRECT_URI = os.getenv('GOOGLE_REDIRECT_URI')
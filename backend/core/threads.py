@@ -0,0 +1,20 @@
+from asgiref.sync import sync_to_async
+from django.db import connections
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Run blocking code (e.g. googleapiclient calls) on a pool thread of its
+    own, so it neither stalls the event loop nor queues behind other
+    requests on the shared sync_to_async thread.
+
+    Database connections the call opens on that thread are closed when it
+    returns.
+    """
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return await sync_to_async(call, thread_sensitive=False)()
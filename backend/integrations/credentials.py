@@ -0,0 +1,173 @@
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from automations.models import Connection
+from core.locks import release_lock
+
+
+@dataclass
+class AccessToken:
+    token: str
+    expiry: datetime
+    refresh_token: str | None = None
+
+    def is_fresh(self, skew) -> bool:
+        return self.expiry - timedelta(seconds=skew) > datetime.now(timezone.utc)
+
+
+def parse_expiry(value) -> datetime | None:
+    """Parse a stored expiry; naive values are UTC, as google-auth writes them."""
+    if not value:
+        return None
+    expiry = datetime.fromisoformat(value)
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry
+
+
+class CredentialManager:
+    """
+    Hands out OAuth access tokens per connection.
+
+    Tokens are cached in process memory and in the shared cache with their
+    real expiry, and refreshed a little before they expire. Only one worker
+    refreshes a given connection at a time (a cache lock); the others wait
+    for and reuse the token it stores.
+    """
+
+    def __init__(self):
+        self._tokens: dict[str, AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, connection, refresh, *, stale_token=None) -> AccessToken | None:
+        """
+        Return a usable access token for the connection.
+
+        ``refresh`` is called as ``refresh(refresh_token)`` and must return
+        ``(access_token, expires_in, new_refresh_token)``. Pass the token a
+        provider just rejected as ``stale_token`` to force a refresh unless
+        another worker already replaced it.
+        """
+        key = str(connection.id)
+        refresh_token = (connection.secrets or {}).get("refresh_token")
+
+        token = self._find_token(connection, stale_token)
+        if token:
+            return token
+
+        if not refresh_token:
+            return None
+
+        lock_key = f"oauth_refresh_lock_{key}"
+        # Only the holder may release it, even if it outlived its timeout
+        lock_token = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.OAUTH_REFRESH_WAIT
+
+        while not cache.add(lock_key, lock_token, timeout=settings.OAUTH_REFRESH_LOCK_TIMEOUT):
+            # Someone else is refreshing; pick up their token when it lands
+            time.sleep(0.2)
+            token = self._find_token(connection, stale_token, include_db=False)
+            if token:
+                return token
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Timed out waiting for token refresh of connection {key}")
+
+        try:
+            # It may have been refreshed between our checks and the lock
+            token = self._find_token(connection, stale_token, include_db=False)
+            if token:
+                return token
+            # _find_token updates secrets if it saw the refresh token rotate
+            return self._refresh(connection, refresh, connection.secrets["refresh_token"])
+        finally:
+            release_lock(lock_key, lock_token)
+
+    def invalidate(self, connection_id):
+        key = str(connection_id)
+        with self._lock:
+            self._tokens.pop(key, None)
+        cache.delete(f"oauth_token_{key}")
+
+    def _find_token(self, connection, stale_token, include_db=True):
+        key = str(connection.id)
+        refresh_token = (connection.secrets or {}).get("refresh_token")
+        skew = settings.OAUTH_REFRESH_SKEW
+
+        def usable(token):
+            return (
+                token is not None
+                and token.token != stale_token
+                and token.refresh_token == refresh_token
+                and token.is_fresh(skew)
+            )
+
+        token = self._tokens.get(key)
+        if usable(token):
+            return token
+
+        token = cache.get(f"oauth_token_{key}")
+        if usable(token):
+            self._remember(key, token)
+            return token
+
+        if token is not None and token.refresh_token != refresh_token:
+            # The provider may have rotated the refresh token in another
+            # worker's refresh; if the stored one now matches, it's ours
+            secrets = Connection.objects.only("secrets").get(id=connection.id).secrets or {}
+            if secrets.get("refresh_token") == token.refresh_token:
+                connection.secrets = secrets
+                refresh_token = token.refresh_token
+                if usable(token):
+                    self._remember(key, token)
+                    return token
+
+        if include_db:
+            secrets = connection.secrets or {}
+            expiry = parse_expiry(secrets.get("expiry"))
+            if secrets.get("access_token") and expiry:
+                token = AccessToken(secrets["access_token"], expiry, refresh_token)
+                if usable(token):
+                    self._store(key, token)
+                    return token
+
+        return None
+
+    def _refresh(self, connection, refresh, refresh_token):
+        access_token, expires_in, new_refresh_token = refresh(refresh_token)
+        expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+
+        with transaction.atomic():
+            locked = Connection.objects.select_for_update().only("secrets").get(id=connection.id)
+            secrets = dict(locked.secrets or {})
+            secrets["access_token"] = access_token
+            secrets["expiry"] = expiry.replace(microsecond=0).isoformat()
+            secrets.pop("expires_at", None)
+            if new_refresh_token:
+                secrets["refresh_token"] = new_refresh_token
+            locked.secrets = secrets
+            locked.save(update_fields=["secrets"])
+
+        connection.secrets = secrets
+        token = AccessToken(access_token, expiry, secrets.get("refresh_token"))
+        self._store(str(connection.id), token)
+        return token
+
+    def _remember(self, key, token):
+        with self._lock:
+            self._tokens[key] = token
+
+    def _store(self, key, token):
+        self._remember(key, token)
+        ttl = int((token.expiry - datetime.now(timezone.utc)).total_seconds())
+        if ttl > 0:
+            cache.set(f"oauth_token_{key}", token, timeout=ttl)
+
+
+credential_manager = CredentialManager()
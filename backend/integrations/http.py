@@ -0,0 +1,130 @@
+import asyncio
+import os
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared by the sync sessions and async_request. Only idempotent methods are
+# retried: a repeated POST could e.g. spend a one-time OAuth code twice.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout."""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url) -> requests.Session:
+    """
+    Return this process's pooled session for the URL's host.
+
+    Sessions keep connections alive between calls, so repeated requests
+    to the same API skip the TCP and TLS handshakes.
+    """
+    host = urlsplit(url).netloc
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = build_session()
+    return session
+
+
+def build_session() -> requests.Session:
+    retry = Retry(
+        total=settings.INTEGRATION_HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=settings.INTEGRATION_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.INTEGRATION_HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+        timeout=(
+            settings.INTEGRATION_HTTP_CONNECT_TIMEOUT,
+            settings.INTEGRATION_HTTP_READ_TIMEOUT,
+        ),
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled httpx client for the running event loop.
+
+    An AsyncClient is bound to the loop it first ran on. Under ASGI that is
+    the server's single loop; clients left behind by closed loops (e.g.
+    async views run through async_to_sync by a WSGI dev server) are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        for stale in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[stale]
+        client = _async_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.INTEGRATION_HTTP_READ_TIMEOUT,
+                connect=settings.INTEGRATION_HTTP_CONNECT_TIMEOUT,
+            ),
+            limits=httpx.Limits(max_keepalive_connections=settings.INTEGRATION_HTTP_POOL_MAXSIZE),
+            transport=httpx.AsyncHTTPTransport(retries=settings.INTEGRATION_HTTP_RETRIES),
+        )
+    return client
+
+
+async def async_request(method, url, **kwargs) -> httpx.Response:
+    """
+    Send a request on the loop's pooled client, retrying the same methods
+    and statuses as the sync sessions with exponential backoff (honouring
+    Retry-After).
+    """
+    client = get_async_client()
+    retries = settings.INTEGRATION_HTTP_RETRIES if method.upper() in RETRY_METHODS else 0
+    for attempt in range(retries + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else 0.5 * 2 ** attempt
+        await response.aclose()
+        await asyncio.sleep(delay)
+
+
+def _reset_sessions():
+    # Pooled sockets must not be shared with forked worker processes
+    _sessions.clear()
+    _async_clients.clear()
+
+
+os.register_at_fork(after_in_child=_reset_sessions)
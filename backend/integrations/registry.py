@@ -1,6 +1,8 @@
 # integrations/registry.py
+from dataclasses import dataclass
 from typing import Dict
 from integrations.services.base import BaseIntegrationService
+from integrations.schemas import ConfigValidator
 # from integrations.services.google_forms import GoogleFormsService
 # from integrations.services.gmail import GmailService
 
@@ -23,3 +25,45 @@ def get_integration_service(integration_id, connection=None) -> BaseIntegrationS
     if not service_cls:
         raise ValueError(f"Integration '{integration_id}' not found.")
     return service_cls(connection)
+
+
+@dataclass(frozen=True)
+class ConfigSpec:
+    key: str
+    config_schema: dict
+    validate: ConfigValidator
+
+
+_catalogs: Dict[tuple, Dict[str, ConfigSpec]] = {}
+
+
+def _get_catalog(integration_id, attribute) -> Dict[str, ConfigSpec]:
+    catalog = _catalogs.get((integration_id, attribute))
+    if catalog is not None:
+        return catalog
+
+    service_cls = INTEGRATION_REGISTRY.get(integration_id)
+    if not service_cls:
+        return {}
+
+    catalog = {}
+    for key, definition in getattr(service_cls, attribute).items():
+        schema = definition.get("config_schema") or {}
+        catalog[key] = ConfigSpec(key=key, config_schema=schema, validate=ConfigValidator(schema))
+    _catalogs[(integration_id, attribute)] = catalog
+    return catalog
+
+
+def get_action_catalog(integration_id) -> Dict[str, ConfigSpec]:
+    """
+    The integration's actions with their config validators, compiled once
+    per process from the class-level ACTIONS. Validation reads this rather
+    than instantiating a service. Empty for unknown integrations (not
+    cached, in case the integration registers later).
+    """
+    return _get_catalog(integration_id, "ACTIONS")
+
+
+def get_trigger_catalog(integration_id) -> Dict[str, ConfigSpec]:
+    """Like get_action_catalog, for the class-level TRIGGERS."""
+    return _get_catalog(integration_id, "TRIGGERS")
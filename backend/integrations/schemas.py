@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+_MISSING = object()
+
+# config_schema "type" -> accepted Python types. bool is an int subclass,
+# so numbers rule it out explicitly.
+TYPE_CHECKS = {
+    "string": (lambda value: isinstance(value, str), "Must be a string."),
+    "number": (lambda value: isinstance(value, (int, float)) and not isinstance(value, bool), "Must be a number."),
+    "integer": (lambda value: isinstance(value, int) and not isinstance(value, bool), "Must be an integer."),
+    "boolean": (lambda value: isinstance(value, bool), "Must be a boolean."),
+    "array": (lambda value: isinstance(value, list), "Must be a list."),
+    "object": (lambda value: isinstance(value, dict), "Must be an object."),
+}
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    name: str
+    required: bool
+    default: Any
+    type_check: Any
+    type_message: str | None
+    enum: tuple | None
+
+
+class ConfigValidator:
+    """
+    A config_schema compiled once into per-field rules.
+
+    Calling it with a config returns `(config, errors)`: the config with
+    defaults filled in for absent optional fields, and a {field: message}
+    dict that is empty when the config is valid. `partial=True` skips the
+    required checks and defaults, for drafts that are still being filled
+    in; `provided` names fields supplied elsewhere (e.g. a connection's
+    secrets) that satisfy `required`.
+    """
+
+    def __init__(self, schema):
+        self.rules = tuple(compile_field(name, spec or {}) for name, spec in (schema or {}).items())
+        self.required_fields = tuple(rule.name for rule in self.rules if rule.required)
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def __call__(self, config, *, partial=False, provided=()) -> tuple[dict, dict[str, str]]:
+        config = dict(config or {})
+        errors = {}
+
+        for rule in self.rules:
+            value = config.get(rule.name, _MISSING)
+
+            if value is _MISSING or value is None:
+                if partial:
+                    continue
+                if rule.required and rule.name not in provided:
+                    errors[rule.name] = "This field is required."
+                elif rule.default is not _MISSING and not rule.required:
+                    config[rule.name] = rule.default
+                continue
+
+            if rule.type_check is not None and not rule.type_check(value):
+                errors[rule.name] = rule.type_message
+            elif rule.required and not partial and isinstance(value, str) and not value.strip():
+                errors[rule.name] = "This field cannot be blank."
+            elif rule.enum is not None and value not in rule.enum:
+                errors[rule.name] = f"Must be one of: {', '.join(map(str, rule.enum))}."
+
+        return config, errors
+
+
+def compile_field(name, spec) -> FieldRule:
+    type_check, type_message = TYPE_CHECKS.get(spec.get("type"), (None, None))
+    enum = spec.get("enum")
+    return FieldRule(
+        name=name,
+        required=spec.get("required") is True,
+        default=spec.get("default", _MISSING),
+        type_check=type_check,
+        type_message=type_message,
+        enum=tuple(enum) if enum is not None else None,
+    )
+
+
+_integration_validators: dict[str, tuple[Any, ConfigValidator]] = {}
+
+
+def get_integration_validator(integration) -> ConfigValidator:
+    """
+    Validator for an Integration row's config_schema. The schema is
+    editable in the database, so it is recompiled when the row changes.
+    """
+    cached = _integration_validators.get(integration.id)
+    if cached is not None and cached[0] == integration.updated_at:
+        return cached[1]
+
+    validator = ConfigValidator(integration.config_schema)
+    _integration_validators[integration.id] = (integration.updated_at, validator)
+    return validator
+
+
+def format_config_errors(errors) -> list[str]:
+    return [f"Config field '{field}': {message}" for field, message in errors.items()]
@@ -1,16 +1,18 @@
 from __future__ import annotations
-import json, time
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
-import requests
-from datetime import timedelta, timezone, datetime
+from datetime import datetime, timedelta, timezone
 
+from asgiref.sync import sync_to_async
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from google.auth.transport.requests import Request
 
 from core.settings import GOOGLE_CLIENT_CONFIG
 from automations.models import Connection
+from integrations.credentials import AccessToken, credential_manager
+from integrations.http import async_request, get_session
+from core.threads import run_blocking
 
 
 class BaseIntegrationService(ABC):
@@ -64,7 +66,11 @@ class BaseIntegrationService(ABC):
         pass
 
     @abstractmethod
-    def perform_action(self, action_id, connection, payload):
+    def perform_action(self, action_id, *, config, connection, context, mode="live"):
+        """
+        Run an action. With mode="test" it must not cause side effects or
+        call the provider; it returns what the live run would have done.
+        """
         pass
 
     def connect(self, config, secrets) -> Dict[str, Any]:
@@ -75,6 +81,14 @@ class BaseIntegrationService(ABC):
         """
         return {}
 
+    async def aconnect(self, config, secrets) -> Dict[str, Any]:
+        """Async connect for async views; runs connect() on a worker thread unless overridden."""
+        return await run_blocking(self.connect, config, secrets)
+
+    async def atest_connection(self) -> bool:
+        """Async test_connection for async views; runs it on a worker thread unless overridden."""
+        return await run_blocking(self.test_connection)
+
     def refresh_token(self) -> None:
         """Refresh tokens if applicable (OAuth)."""
         pass
@@ -87,22 +101,60 @@ class BaseIntegrationService(ABC):
         """Optional: list resources like forms, sheets, etc."""
         return []
 
+    def get_access_token(self, *, stale_token=None) -> str | None:
+        """Token sent with HTTP requests. OAuth services override this."""
+        return self.secrets.get("access_token")
+
+    def http_request(self, method, url, headers=None, retry=True, **kwargs):
+        """Helper for HTTP requests with token support over pooled sessions."""
+        headers = headers or {}
+        if token := self.get_access_token():
+            headers["Authorization"] = f"Bearer {token}"
+        session = get_session(url)
+        response = session.request(method, url, headers=headers, **kwargs)
+
+        # Tokens are refreshed ahead of expiry, so a 401 means the token was
+        # revoked or rotated elsewhere. Swap it once and retry.
+        if response.status_code == 401 and retry and token:
+            new_token = self.get_access_token(stale_token=token)
+            if new_token and new_token != token:
+                headers['Authorization'] = f"Bearer {new_token}"
+                response = session.request(method, url, headers=headers, **kwargs)
+
+        response.raise_for_status()
+        return response.json() if response.content else None
+
     def http_get(self, url, headers=None, params=None, retry=True):
-        """Helper for GET requests with token support."""
+        return self.http_request("GET", url, headers=headers, params=params, retry=retry)
+
+    async def ahttp_request(self, method, url, headers=None, retry=True, **kwargs):
+        """Async http_request over the event loop's pooled httpx client."""
         headers = headers or {}
-        if token := self.secrets.get("access_token"):
+        # Token lookup touches the cache and the database (and rarely refreshes)
+        if token := await sync_to_async(self.get_access_token)():
             headers["Authorization"] = f"Bearer {token}"
-        response = requests.get(url, headers=headers, params=params)
+        response = await async_request(method, url, headers=headers, **kwargs)
 
-        if response.status_code in (400, 401, 403) and retry:
-            self.refresh_token()
-            new_token = self.secrets.get("access_token")
-            if new_token:
+        if response.status_code == 401 and retry and token:
+            new_token = await sync_to_async(self.get_access_token)(stale_token=token)
+            if new_token and new_token != token:
                 headers['Authorization'] = f"Bearer {new_token}"
-                response = requests.get(url, headers=headers, params=params)
+                response = await async_request(method, url, headers=headers, **kwargs)
 
         response.raise_for_status()
-        return response.json()
+        return response.json() if response.content else None
+
+    async def ahttp_get(self, url, headers=None, params=None, retry=True):
+        return await self.ahttp_request("GET", url, headers=headers, params=params, retry=retry)
+
+    def http_post(self, url, headers=None, json=None, data=None, retry=True):
+        return self.http_request("POST", url, headers=headers, json=json, data=data, retry=retry)
+
+    def http_put(self, url, headers=None, json=None, data=None, retry=True):
+        return self.http_request("PUT", url, headers=headers, json=json, data=data, retry=retry)
+
+    def http_patch(self, url, headers=None, json=None, data=None, retry=True):
+        return self.http_request("PATCH", url, headers=headers, json=json, data=data, retry=retry)
     
     def get_auth_url(self, **kwargs):
         pass
@@ -110,6 +162,16 @@ class BaseIntegrationService(ABC):
     def bind_trigger_instance(self, trigger_instance):
         self.trigger_instance = trigger_instance
 
+    @classmethod
+    def build_trigger_query(cls, trigger_key, config, since=None) -> dict:
+        """
+        Compile a trigger's config into provider-side query params.
+
+        Triggers list the config fields the provider can filter on under
+        "query_fields"; anything not listed is still matched after download.
+        """
+        return {}
+
     @classmethod
     def as_dict(cls):
         return {
@@ -131,6 +193,8 @@ class GoogleBaseService(BaseIntegrationService):
 
     oauth_enabled = True
     GOOGLE_API_BASE = "https://www.googleapis.com"
+    GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+    OAUTH_REDIRECT_URI = "http://localhost:8000/api/integrations/oauth/google/callback/"
     GOOGLE_CLIENT_CONFIG = GOOGLE_CLIENT_CONFIG
 
     def __init__(self, connection: Optional["Connection"] = None):
@@ -147,7 +211,7 @@ class GoogleBaseService(BaseIntegrationService):
         flow = Flow.from_client_config(
             cls.GOOGLE_CLIENT_CONFIG,
             scopes=cls.get_scopes(),
-            redirect_uri="http://localhost:8000/api/integrations/oauth/google/callback/",
+            redirect_uri=cls.OAUTH_REDIRECT_URI,
         )
         state = json.dumps({
             "connection_id": str(connection_id), 
@@ -165,7 +229,7 @@ class GoogleBaseService(BaseIntegrationService):
         flow = Flow.from_client_config(
             cls.GOOGLE_CLIENT_CONFIG,
             scopes=cls.get_scopes(),
-            redirect_uri="http://localhost:8000/api/integrations/oauth/google/callback/",
+            redirect_uri=cls.OAUTH_REDIRECT_URI,
         )
         flow.fetch_token(code=code)
         creds = flow.credentials
@@ -175,6 +239,34 @@ class GoogleBaseService(BaseIntegrationService):
             "refresh_token": creds.refresh_token,
             "expiry": creds.expiry.isoformat() if creds.expiry else None,
         }
+
+    @classmethod
+    async def aexchange_code(cls, code: str) -> dict:
+        """exchange_code over the async client, for async views."""
+        response = await async_request("POST", cls.GOOGLE_TOKEN_URL, data={
+            "code": code,
+            "client_id": cls.GOOGLE_CLIENT_CONFIG["web"]["client_id"],
+            "client_secret": cls.GOOGLE_CLIENT_CONFIG["web"]["client_secret"],
+            "redirect_uri": cls.OAUTH_REDIRECT_URI,
+            "grant_type": "authorization_code",
+        })
+        response.raise_for_status()
+        tokens = response.json()
+
+        # Same shape as exchange_code: naive UTC expiry, as google-auth reports it
+        expiry = None
+        if "expires_in" in tokens:
+            expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=tokens["expires_in"])
+
+        return {
+            "access_token": tokens["access_token"],
+            "refresh_token": tokens.get("refresh_token"),
+            "expiry": expiry.isoformat() if expiry else None,
+        }
+
+    async def aconnect(self, config, secrets) -> Dict[str, Any]:
+        # Google services connect by exchanging the authorization code
+        return await self.aexchange_code(secrets["authorization_code"])
     
     def get_client(self, connection):
         assert connection is not None, "Connection is None"
@@ -182,29 +274,30 @@ class GoogleBaseService(BaseIntegrationService):
         if connection.status != "active":
             raise RuntimeError("Connection is not active")
 
-        creds = self.build_credentials()
-
-        if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-
-            connection.secrets.update({
-                "access_token": creds.token,
-                "expires_at": int(time.time() + creds.expiry.timestamp())
-            })
-            connection.save(update_fields=["secrets"])
+        access_token = credential_manager.get_token(connection, self.request_access_token)
+        creds = self.build_credentials(access_token)
 
         return self.build_client(creds)
 
-    def build_credentials(self) -> Credentials:
+    def build_credentials(self, access_token: AccessToken | None = None) -> Credentials:
         """Builds a google Credentials object from stored secrets."""
         # NOTE: Enforcing this causes a bug where rightfully minimal connections are halted (no secrets at this point). Fix logic for enforcement.
         # if not self.secrets:
         #     raise RuntimeError("Connection secrets are missing. User must reconnect.")
-        
+
+        if access_token:
+            token = access_token.token
+            # google-auth compares expiry as naive UTC
+            expiry = access_token.expiry.astimezone(timezone.utc).replace(tzinfo=None)
+        else:
+            token = self.secrets.get("access_token")
+            expiry = None
+
         return Credentials(
-            token=self.secrets.get("access_token"),
+            token=token,
+            expiry=expiry,
             refresh_token=self.secrets.get("refresh_token"),
-            token_uri="https://oauth2.googleapis.com/token",
+            token_uri=self.GOOGLE_TOKEN_URL,
             client_id=self.client_config["web"]["client_id"],
             client_secret=self.client_config["web"]["client_secret"],
             scopes=self.get_scopes()
@@ -214,13 +307,18 @@ class GoogleBaseService(BaseIntegrationService):
         raise NotImplementedError
 
     # ---- Common OAuth utilities ----
+    def get_access_token(self, *, stale_token=None) -> str | None:
+        access_token = credential_manager.get_token(
+            self.connection, self.request_access_token, stale_token=stale_token
+        )
+        return access_token.token if access_token else self.secrets.get("access_token")
+
     def refresh_token(self) -> None:
-        """Refresh access token when expired."""
-        refresh_token = self.secrets.get("refresh_token")
-        if not refresh_token:
-            print("No refresh token")
-            return
+        """Force a refresh of the current access token."""
+        self.get_access_token(stale_token=self.secrets.get("access_token"))
 
+    def request_access_token(self, refresh_token):
+        """Trade a refresh token for a new access token at Google."""
         data = {
             "client_id": self.client_config["web"]["client_id"],
             "client_secret": self.client_config["web"]["client_secret"],
@@ -228,19 +326,12 @@ class GoogleBaseService(BaseIntegrationService):
             "grant_type": "refresh_token",
         }
  
-        r = requests.post("https://oauth2.googleapis.com/token", data=data)
+        r = get_session(self.GOOGLE_TOKEN_URL).post(self.GOOGLE_TOKEN_URL, data=data)
         r.raise_for_status()
         tokens = r.json()
+        print("Tokens refreshed")
 
-        secrets = self.secrets
-        secrets["access_token"] = tokens["access_token"]
-
-        if "expires_in" in tokens:
-            print("Tokens refreshed")
-            expiry_time = datetime.utcnow() + timedelta(seconds=tokens["expires_in"])
-            secrets["expiry"] = expiry_time.replace(microsecond=0).isoformat() 
-
-        self.secrets = secrets
+        return tokens["access_token"], tokens.get("expires_in", 3600), tokens.get("refresh_token")
 
     def test_connection(self) -> bool:
         """Try a simple request to confirm credentials are valid."""
@@ -248,6 +339,14 @@ class GoogleBaseService(BaseIntegrationService):
         try:
             self.http_get(f"{self.GOOGLE_API_BASE}/oauth2/v3/tokeninfo")
             return True
+        except Exception as e:
+            print(e)
+            return False
+
+    async def atest_connection(self) -> bool:
+        try:
+            await self.ahttp_get(f"{self.GOOGLE_API_BASE}/oauth2/v3/tokeninfo")
+            return True
         except Exception as e:
             print(e)
             return False
\ No newline at end of file
@@ -1,15 +1,16 @@
 from typing import Any, Dict
-from googleapiclient.discovery import build
 from email.mime.text import MIMEText
 from email.utils import parseaddr
 import base64, json
 from datetime import datetime, timezone as p_timezone
 from email.mime.multipart import MIMEMultipart
 from google.auth.exceptions import RefreshError
+from googleapiclient.errors import HttpError
 
 
 from .base import GoogleBaseService
 from integrations.registry import register_integration
+from integrations.transports import get_api_client
 from core.events.factory import build_event
 
 
@@ -46,6 +47,9 @@ class GmailService(GoogleBaseService):
                     "help_text": "Whether to include attachments in the trigger payload."
                 }
             },
+            "query_fields": {
+                "sender": "from"
+            },
             "fetch": "fetch_new_emails",
             "normalize": "normalize_new_email",
             "sample_event": "sample_new_email"
@@ -101,9 +105,9 @@ class GmailService(GoogleBaseService):
     }
 
     def build_client(self, credentials):
-        return build("gmail", "v1", credentials=credentials)
+        return get_api_client(self.connection.id, credentials, "gmail", "v1")
 
-    def perform_action(self, action_id, *, config, connection, context):
+    def perform_action(self, action_id, *, config, connection, context, mode="live"):
         action_map = {
             "send_email": self.send_email
         }
@@ -111,14 +115,10 @@ class GmailService(GoogleBaseService):
             raise ValueError(f"Unknown action: {action_id}")
         return action_map[action_id](
             config=config,
-            connection=connection
+            connection=connection,
+            mode=mode
         )
 
-    def __init__(self, connection=None):
-        super().__init__(connection)
-        self.credentials = self.build_credentials()
-        self.service = build("gmail", "v1", credentials=self.credentials)
-
     def connect(self, config, secrets) -> Dict[str, Any]:
         return self.exchange_code(secrets["authorization_code"])
 
@@ -128,44 +128,177 @@ class GmailService(GoogleBaseService):
         }
         return headers_as_dict
 
+    @classmethod
+    def build_trigger_query(cls, trigger_key, config, since=None):
+        query_fields = cls.TRIGGERS[trigger_key].get("query_fields", {})
+        terms = [
+            f"{operator}:({config[field]})"
+            for field, operator in query_fields.items()
+            if config.get(field)
+        ]
+        if not terms:
+            return {}
+
+        # `match_q` is the filter alone: history-based polls use it, since a
+        # delayed or moved message can be dated before the high-water mark.
+        query = {"q": " ".join(terms), "match_q": " ".join(terms)}
+        if since:
+            query["q"] += f" after:{int(since.timestamp())}"
+        return query
+
     # ----- Trigger: New Emails -----
-    def fetch_new_emails(self, client, *, since_cursor, limit):
+    def fetch_new_emails(self, client, *, since_cursor, limit, cursor, query):
+        """
+        Fetch emails added to the inbox since the last poll.
+
+        The first poll lists the inbox and records the mailbox historyId on
+        the cursor. Later polls only ask Gmail for the history since then,
+        so a quiet mailbox costs a single history.list call. An expired
+        historyId falls back to a full listing.
+        """
+        message_ids = None
+
+        if cursor.get("history_id"):
+            try:
+                message_ids, history_id = self._list_added_message_ids(
+                    client, start_history_id=cursor["history_id"], limit=limit
+                )
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+
+        if message_ids is None:
+            # Read the historyId before listing so nothing lands in between
+            profile = client.users().getProfile(userId="me").execute()
+            history_id = profile["historyId"]
+            message_ids = self._list_inbox_message_ids(
+                client, limit=limit, q=query.get("q")
+            )
+        elif message_ids and query.get("match_q"):
+            # History can't be searched, so narrow the new messages down to
+            # the ones matching the query before downloading any of them.
+            matching_ids = self._find_matching_message_ids(
+                client, candidates=message_ids, q=query["match_q"]
+            )
+            message_ids = [mid for mid in message_ids if mid in matching_ids]
+
+        messages = []
+
+        for message_id in message_ids:
+            try:
+                full_message = client.users().messages().get(
+                    userId="me",
+                    id=message_id,
+                    format="full",
+                ).execute()
+            except HttpError as e:
+                # Message was deleted between listing and download
+                if e.resp.status == 404:
+                    continue
+                raise
+
+            messages.append(full_message)
+
+        cursor["history_id"] = history_id
+        return messages
+
+    def _list_inbox_message_ids(self, client, *, limit, q=None):
         response = client.users().messages().list(
             userId="me",
             maxResults=limit,
             labelIds=["INBOX"],
             includeSpamTrash=False,
+            q=q,
         ).execute()
 
-        messages = []
+        return [item["id"] for item in response.get("messages", [])]
 
-        for item in response.get("messages", []):
-            message_id = item["id"]
+    def _find_matching_message_ids(self, client, *, candidates, q):
+        """
+        Which of the candidate IDs the search `q` matches.
 
-            metadata = client.users().messages().get(
+        The search is bounded below by the earliest candidate's internalDate
+        (not its Date header, so delayed or moved mail still counts), then
+        paged until every candidate has been seen or the results run out.
+        A candidate the query doesn't match thus costs at most the matches
+        received since then, never a walk through the whole mailbox.
+        """
+        earliest_ms = None
+        remaining = set()
+        for message_id in candidates:
+            try:
+                message = client.users().messages().get(
+                    userId="me",
+                    id=message_id,
+                    format="minimal",
+                ).execute()
+            except HttpError as e:
+                if e.resp.status == 404:
+                    continue
+                raise
+            remaining.add(message_id)
+            internal_ms = int(message["internalDate"])
+            if earliest_ms is None or internal_ms < earliest_ms:
+                earliest_ms = internal_ms
+
+        if not remaining:
+            return set()
+
+        # after: is exclusive and in seconds; a second of slack keeps the
+        # earliest candidate itself in range
+        q = f"{q} after:{earliest_ms // 1000 - 1}"
+        matching_ids = set()
+        page_token = None
+
+        while remaining:
+            response = client.users().messages().list(
                 userId="me",
-                id=message_id,
-                format="metadata",
-                metadataHeaders=["Date"],
+                maxResults=500,
+                labelIds=["INBOX"],
+                includeSpamTrash=False,
+                q=q,
+                pageToken=page_token,
             ).execute()
 
-            internal_date = datetime.fromtimestamp(
-                int(metadata["internalDate"])/ 1000,
-                tz=p_timezone.utc
-)
-            # if since_cursor and internal_date <= since_cursor:
-            #     continue
+            for item in response.get("messages", []):
+                if item["id"] in remaining:
+                    remaining.discard(item["id"])
+                    matching_ids.add(item["id"])
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
-            full_message = client.users().messages().get(
+        return matching_ids
+
+    def _list_added_message_ids(self, client, *, start_history_id, limit):
+        message_ids = []
+        page_token = None
+
+        while True:
+            response = client.users().history().list(
                 userId="me",
-                id=message_id,
-                format="full",
+                startHistoryId=start_history_id,
+                historyTypes=["messageAdded"],
+                labelId="INBOX",
+                pageToken=page_token,
             ).execute()
 
-            messages.append(full_message)
+            for record in response.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    message_id = added["message"]["id"]
+                    if message_id not in message_ids:
+                        message_ids.append(message_id)
+
+                if len(message_ids) >= limit:
+                    # Resume from this record on the next poll instead of
+                    # downloading an unbounded backlog now.
+                    return message_ids, record["id"]
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return message_ids, response["historyId"]
 
-        return messages
-    
     def normalize_new_email(self, payload):
         headers = {
             h["name"].lower(): h["value"] for h in payload["payload"]["headers"]
@@ -223,8 +356,7 @@ class GmailService(GoogleBaseService):
             message.as_bytes()
         ).decode("utf-8")
 
-        client = self.get_client(connection)
-
+        # Test mode never touches Gmail, not even for a token
         if mode == "test":
             return {
                 "status": "skipped",
@@ -233,6 +365,8 @@ class GmailService(GoogleBaseService):
                 "subject": subject
             }
 
+        client = self.get_client(connection)
+
         try:
             response = client.users().messages().send(
                 userId="me",
@@ -1,11 +1,11 @@
 from typing import Any, Dict
-from googleapiclient.discovery import build
-from datetime import datetime
+from datetime import datetime, timezone as p_timezone
 from django.conf import settings
 from django.utils import timezone
 
 from .base import BaseIntegrationService, GoogleBaseService
 from integrations.registry import register_integration
+from integrations.transports import get_api_client
 from core.events.factory import build_event
 
 
@@ -47,41 +47,57 @@ class GoogleFormsService(GoogleBaseService):
         return cls.SCOPES
 
     def build_client(self, credentials):
-        return build("forms", "v1", credentials=credentials)
+        return get_api_client(self.connection.id, credentials, "forms", "v1")
     
-    def perform_action(self, action_id, connection, payload):
-        return super().perform_action(action_id, connection, payload)
+    def perform_action(self, action_id, *, config, connection, context, mode="live"):
+        return super().perform_action(action_id, config=config, connection=connection, context=context, mode=mode)
     
     def connect(self, config, secrets) -> Dict[str, Any]:
         return self.exchange_code(secrets["authorization_code"])
     
+    @classmethod
+    def build_trigger_query(cls, trigger_key, config, since=None):
+        if not since:
+            return {}
+        timestamp = since.astimezone(p_timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        # Inclusive, so responses sharing the high-water mark aren't lost;
+        # the executor drops the ones it has already seen.
+        return {"filter": f"timestamp >= {timestamp}"}
+
     # ----- Trigger: New Responses -----
-    def fetch_new_responses(self, client, *, since_cursor, limit):
+    def fetch_new_responses(self, client, *, since_cursor, limit, cursor, query):
         """
-        Fetch new Google Form responses since the last cursor.
+        Stream Google Form responses submitted after the cursor.
+
+        The timestamp filter is applied server side and every page is
+        followed, so busy forms don't lose responses past the first page.
         """
 
         form_id = self.trigger_instance.config["form_id"]
+        page_token = None
 
-        response = client.forms().responses().list(
-            formId=form_id,
-            pageSize=limit,
-        ).execute()
+        while True:
+            response = client.forms().responses().list(
+                formId=form_id,
+                pageSize=limit,
+                filter=query.get("filter"),
+                pageToken=page_token,
+            ).execute()
 
-        new_responses = []
+            for item in response.get("responses", []):
 
-        for item in response.get("responses", []):
-            
-            submitted_at = datetime.fromisoformat(
-                item["lastSubmittedTime"].replace("Z", "+00:00")
-            )
+                submitted_at = datetime.fromisoformat(
+                    item["lastSubmittedTime"].replace("Z", "+00:00")
+                )
 
-            if since_cursor and submitted_at <= since_cursor:
-                continue
+                if since_cursor and submitted_at < since_cursor:
+                    continue
 
-            new_responses.append(item)
+                yield item
 
-        return new_responses
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
 
     def normalize_new_response(self, payload):
         return build_event(
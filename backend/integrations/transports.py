@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+import httplib2
+from django.conf import settings
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+
+
+@dataclass
+class Transport:
+    refresh_token: str | None
+    http: AuthorizedHttp
+    clients: Dict[tuple, Any] = field(default_factory=dict)
+
+
+# httplib2 is not thread-safe, so every thread (or greenlet, once gevent
+# patches threading.local) keeps its own transports.
+_local = threading.local()
+
+
+def _get_pool() -> OrderedDict:
+    pool = getattr(_local, "transports", None)
+    if pool is None:
+        pool = _local.transports = OrderedDict()
+    return pool
+
+
+def get_transport(connection_id, credentials) -> Transport:
+    """
+    Return this thread's AuthorizedHttp for a connection.
+
+    Transports are reused across calls. A new access token is swapped into
+    the existing transport, while a new refresh token (the user
+    reconnected) replaces the transport entirely.
+    """
+    pool = _get_pool()
+    key = str(connection_id)
+    transport = pool.get(key)
+
+    if transport is not None and transport.refresh_token != credentials.refresh_token:
+        transport.http.http.close()
+        transport = None
+
+    if transport is None:
+        http = httplib2.Http(timeout=settings.INTEGRATION_HTTP_READ_TIMEOUT)
+        transport = Transport(
+            refresh_token=credentials.refresh_token,
+            http=AuthorizedHttp(credentials, http=http),
+        )
+        pool[key] = transport
+        if len(pool) > settings.GOOGLE_TRANSPORT_POOL_SIZE:
+            _, evicted = pool.popitem(last=False)
+            evicted.http.http.close()
+    else:
+        current = transport.http.credentials
+        if credentials.token and credentials.token != current.token:
+            current.token = credentials.token
+            current.expiry = credentials.expiry
+        pool.move_to_end(key)
+
+    return transport
+
+
+def get_api_client(connection_id, credentials, api, version):
+    """Return a discovery client for the API bound to this thread's transport."""
+    transport = get_transport(connection_id, credentials)
+    client = transport.clients.get((api, version))
+    if client is None:
+        client = build(api, version, http=transport.http, cache_discovery=False)
+        transport.clients[(api, version)] = client
+    return client
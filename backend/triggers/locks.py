@@ -0,0 +1,44 @@
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.locks import release_lock
+
+
+class PollLease:
+    """
+    A short-lived, cache-backed lease (SET NX with a TTL) on one trigger.
+
+    While held, a background thread keeps renewing the TTL so a slow poll
+    doesn't lose its lease halfway. If the worker dies the lease simply
+    expires.
+    """
+
+    def __init__(self, trigger_id, ttl=None):
+        self.key = f"trigger_poll_lease_{trigger_id}"
+        self.ttl = ttl or settings.TRIGGER_POLL_LEASE_TTL
+        self.token = uuid.uuid4().hex
+        self._stop = threading.Event()
+        self._renewer = None
+
+    def acquire(self) -> bool:
+        if not cache.add(self.key, self.token, timeout=self.ttl):
+            return False
+
+        self._renewer = threading.Thread(target=self._renew, daemon=True)
+        self._renewer.start()
+        return True
+
+    def release(self):
+        self._stop.set()
+        if self._renewer:
+            self._renewer.join()
+        release_lock(self.key, self.token)
+
+    def _renew(self):
+        while not self._stop.wait(self.ttl / 3):
+            if cache.get(self.key) != self.token:
+                return
+            cache.touch(self.key, timeout=self.ttl)
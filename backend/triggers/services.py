@@ -1,44 +1,106 @@
 from integrations.registry import INTEGRATION_REGISTRY
+import logging
 import traceback
-from datetime import datetime, timezone
+from itertools import islice
+from datetime import timedelta
 
+from django.conf import settings
 from django.utils import timezone
 from django.db import IntegrityError, transaction
 from automations.engine import process_events
-from automations.models import Trigger, Automation, EventRecord
+from automations.models import Trigger, TriggerCursor, Automation, EventRecord
+from core.metrics import incr_metric
+from triggers.locks import PollLease
+
+logger = logging.getLogger(__name__)
 
 
 class PollingTriggerExecutor:
-    def run(self, *, service, trigger_key, trigger_instance, connection, payload=None, mode="test", since_cursor, limit):
+    def run(self, *, service, trigger_key, trigger_instance, connection, payload=None, mode="test", limit):
+        # Test runs start from a blank cursor that is never saved, so they
+        # always show recent items without disturbing the live poll state.
+        cursor = TriggerCursor(trigger=trigger_instance)
+        if mode == "live":
+            cursor, _ = TriggerCursor.objects.get_or_create(trigger=trigger_instance)
+
+        events = self.stream(
+            service=service,
+            trigger_key=trigger_key,
+            trigger_instance=trigger_instance,
+            connection=connection,
+            cursor=cursor,
+            limit=limit
+        )
+
+        if mode == "test":
+            # Only a handful of samples are needed; stop paging early
+            return list(islice(events, limit))
+
+        events = list(events)
+        self.save_cursor(trigger_instance, cursor)
+        return events
+
+    def stream(self, *, service, trigger_key, trigger_instance, connection, cursor, limit, client=None):
+        """
+        Yield normalized events one at a time, advancing `cursor` in memory.
+
+        The fetch function reads and updates the provider token on the
+        cursor; the high-water mark and the IDs seen at it are tracked here.
+        Nothing is saved: the caller persists the cursor together with the
+        events, so a poll that dies halfway resumes from the old position.
+        """
         service.bind_trigger_instance(trigger_instance)
         trigger = service.TRIGGERS[trigger_key]
-        client = service.get_client(connection)
-        since = None
-        if mode == "live":
-            since = trigger_instance.last_run_at
+        if client is None:
+            client = service.get_client(connection)
+        since = cursor.high_water_mark
+
+        # Filters the provider can apply itself are pushed into the fetch
+        # so non-matching items are never downloaded.
+        query = service.build_trigger_query(
+            trigger_key, trigger_instance.config or {}, since
+        )
 
         raw_items = getattr(service, trigger["fetch"])(
             client=client,
             since_cursor=since,
-            limit=limit
+            limit=limit,
+            cursor=cursor.token,
+            query=query
         )
 
-        events = [
-            getattr(service, trigger["normalize"])(item)
-            for item in raw_items
-        ]
+        seen_ids = set(cursor.recent_ids)
+        high_water_mark = since
+        recent_ids = list(cursor.recent_ids)
+        normalize = getattr(service, trigger["normalize"])
 
-        if mode == "live" and events:
-            trigger_instance.last_run_at = max(
-                e.occurred_at for e in events
-            )
-            trigger_instance.save(update_fields=["last_run_at"])
+        for item in raw_items:
+            event = normalize(item)
 
-        return events
+            # Providers fetch inclusively from the high-water mark; drop what
+            # was already delivered at exactly that instant.
+            if since and event.occurred_at <= since and event.source_id in seen_ids:
+                continue
+
+            if high_water_mark is None or event.occurred_at > high_water_mark:
+                high_water_mark = event.occurred_at
+                recent_ids = [event.source_id]
+            elif event.occurred_at == high_water_mark:
+                recent_ids.append(event.source_id)
+
+            yield event
+
+        cursor.high_water_mark = high_water_mark
+        cursor.recent_ids = recent_ids[-settings.TRIGGER_CURSOR_RECENT_IDS:]
+
+    def save_cursor(self, trigger_instance, cursor):
+        cursor.save()
+        trigger_instance.last_run_at = timezone.now()
+        trigger_instance.save(update_fields=["last_run_at"])
     
 
 class WebhookTriggerExecutor:
-    def run(self, *, service, trigger_key, connection=None, trigger_instance=None, payload=None, mode="live", since_cursor=None, limit=None):
+    def run(self, *, service, trigger_key, connection=None, trigger_instance=None, payload=None, mode="live", limit=None):
         trigger = service.TRIGGERS[trigger_key]
 
         if mode == "test":
@@ -87,8 +149,6 @@ def run_trigger_test(*, service, trigger_key, trigger_instance, connection):
             connection=connection,
             trigger_instance=trigger_instance,
             mode="test",
-            # TODO: Use appropriate cursor
-            since_cursor=None,
             limit=10
         )
     except Exception as e:
@@ -160,25 +220,107 @@ def event_matches_trigger(event, trigger_instance):
 
     return True
 
-def run_trigger_live(trigger_instance):
-    print("This is RUN TRIGGER LIVE")
-    print("This is the trigger instance ---> ", trigger_instance)
+def run_connection_triggers(trigger_instances):
+    """
+    Poll several triggers that share one connection.
+
+    The service and API client are built once and reused for every
+    trigger. Returns the ids of triggers whose poll failed.
+    """
+    connection = trigger_instances[0].connection
+    service = INTEGRATION_REGISTRY[trigger_instances[0].integration.id](connection)
+    client = service.get_client(connection)
+    failed_ids = []
+
+    for trigger_instance in trigger_instances:
+        try:
+            run_trigger_live(trigger_instance, service=service, client=client)
+        except Exception:
+            traceback.print_exc()
+            failed_ids.append(str(trigger_instance.id))
+
+    return failed_ids
+
+
+def run_trigger_live(trigger_instance, *, service=None, client=None):
+    logger.debug("Running trigger %s live", trigger_instance.id)
+    # Overlapping polls of one trigger (slow poll + next tick, or a retry)
+    # would double API usage and race on the cursor, so only one may run.
+    lease = PollLease(trigger_instance.id)
+    if not lease.acquire():
+        incr_metric("triggers.poll.lease_held")
+        logger.info("Trigger %s is already being polled. Skipping.", trigger_instance.id)
+        return
+
+    try:
+        trigger_instance.refresh_from_db(fields=["last_run_at", "poll_interval"])
+        _run_trigger_live(trigger_instance, service=service, client=client)
+    finally:
+        lease.release()
+
+
+def _run_trigger_live(trigger_instance, *, service=None, client=None):
     # NOTE: Trigger should be configured with necessary question. This means I should probably enforce connection existence before activating trigger
-    service = INTEGRATION_REGISTRY[trigger_instance.integration.id](trigger_instance.connection)
+    if service is None:
+        service = INTEGRATION_REGISTRY[trigger_instance.integration.id](trigger_instance.connection)
     trigger_definition = service.TRIGGERS[trigger_instance.trigger_key]
     executor = resolve_trigger_executor(trigger_definition)
+    # Loaded after the lease is taken, so it's the latest saved position
+    cursor, _ = TriggerCursor.objects.get_or_create(trigger=trigger_instance)
 
-    events = executor.run(
+    events = executor.stream(
         service=service,
         trigger_key=trigger_instance.trigger_key,
         connection=trigger_instance.connection,
         trigger_instance=trigger_instance,
-        mode="live",
-        since_cursor=trigger_instance.last_run_at,
-        limit=50
+        cursor=cursor,
+        limit=50,
+        client=client
+    )
+
+    # Events are persisted in batches as they stream in, so a large backlog
+    # never has to fit in memory. Persisting is idempotent, so only the last
+    # batch has to be atomic with the cursor update.
+    dispatched = 0
+    batch = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= settings.TRIGGER_EVENT_BATCH_SIZE:
+            with transaction.atomic():
+                dispatched += process_events(batch)
+            batch = []
+
+    with transaction.atomic():
+        dispatched += process_events(batch)
+        executor.save_cursor(trigger_instance, cursor)
+
+    reschedule_trigger(trigger_instance, had_events=dispatched > 0)
+
+
+def clamp_poll_interval(interval):
+    return min(
+        max(interval, settings.TRIGGER_POLL_MIN_INTERVAL),
+        settings.TRIGGER_POLL_MAX_INTERVAL
+    )
+
+
+def reschedule_trigger(trigger_instance, *, had_events):
+    """
+    Adapt the trigger's poll interval to how busy its source is.
+
+    Busy triggers halve their interval, quiet ones back off towards the
+    configured maximum, so idle mailboxes and forms are rarely polled.
+    """
+    if had_events:
+        interval = trigger_instance.poll_interval // 2
+    else:
+        interval = int(trigger_instance.poll_interval * settings.TRIGGER_POLL_BACKOFF)
+
+    trigger_instance.poll_interval = clamp_poll_interval(interval)
+    trigger_instance.next_poll_at = timezone.now() + timedelta(
+        seconds=trigger_instance.poll_interval
     )
-    print("EVENTS FAPPED. ABOUT TO PROCESS EVENTS!!")
-    process_events(events)
+    trigger_instance.save(update_fields=["poll_interval", "next_poll_at"])
 
 
 def persist_event(raw_event):
@@ -1,4 +1,9 @@
+from collections import defaultdict
+from datetime import timedelta
+
 from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
 from automations.models import Trigger, EventRecord
 
 from requests.exceptions import ConnectionError, Timeout
@@ -6,15 +11,45 @@ from requests.exceptions import ConnectionError, Timeout
 
 @shared_task
 def poll_triggers_task():
-    print("RUNNING POLLING TASSKKKKKKKKKKKKKKKK!!!!!!")
-    trigger_ids = Trigger.objects.filter(
-        status="active",
-        type="poll",
-        automation__status="enabled"
-    ).values_list('id', flat=True)
-
-    for trigger_id in trigger_ids:
-        run_trigger_task.delay(trigger_id)
+    from triggers.services import clamp_poll_interval
+    now = timezone.now()
+
+    with transaction.atomic():
+        # Range scan on (type, status, next_poll_at); rows another scheduler
+        # is already claiming are skipped rather than waited on.
+        due_triggers = list(
+            Trigger.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(
+                status="active",
+                type="poll",
+                next_poll_at__lte=now,
+                automation__status="enabled"
+            )
+            .only("id", "connection_id", "poll_interval", "next_poll_at")
+        )
+
+        # Push next_poll_at forward now so the next tick doesn't enqueue a
+        # trigger that is still being polled. The run reschedules it again.
+        for trigger in due_triggers:
+            trigger.next_poll_at = now + timedelta(seconds=clamp_poll_interval(trigger.poll_interval))
+        Trigger.objects.bulk_update(due_triggers, ["next_poll_at"])
+
+        # One task per connection, so triggers sharing an account reuse a
+        # single service and API client.
+        triggers_by_connection = defaultdict(list)
+        for trigger in due_triggers:
+            if trigger.connection_id:
+                triggers_by_connection[trigger.connection_id].append(str(trigger.id))
+            else:
+                transaction.on_commit(
+                    lambda trigger_id=trigger.id: run_trigger_task.delay(trigger_id)
+                )
+
+        for connection_id, trigger_ids in triggers_by_connection.items():
+            transaction.on_commit(
+                lambda connection_id=connection_id, trigger_ids=trigger_ids:
+                    run_connection_triggers_task.delay(str(connection_id), trigger_ids)
+            )
 
 
 @shared_task
@@ -37,3 +72,21 @@ def run_trigger_task(self, trigger_id):
     else:
         print("There is  no trigger")
     run_trigger_live(trigger)
+
+
+@shared_task
+def run_connection_triggers_task(connection_id, trigger_ids):
+    from triggers.services import run_connection_triggers
+    triggers = list(
+        Trigger.objects.select_related("integration", "connection", "automation")
+        .filter(id__in=trigger_ids, connection_id=connection_id)
+    )
+    if not triggers:
+        return
+
+    failed_ids = run_connection_triggers(triggers)
+
+    # Retry failures one by one so triggers that already polled fine aren't
+    # polled again.
+    for trigger_id in failed_ids:
+        run_trigger_task.delay(trigger_id)
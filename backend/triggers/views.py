@@ -1,27 +1,64 @@
-from rest_framework import permissions
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.response import Response
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
 from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.utils.encoders import JSONEncoder
 
 from automations.models import Trigger, Connection
+from automations.services.memberships import get_workspace_roles
+from core.threads import run_blocking
 from triggers.services import run_trigger_test
 from integrations.registry import INTEGRATION_REGISTRY
+from users.authentication import authenticate_async
 
 
+@sync_to_async
+def get_visible_trigger(user, pk):
+    try:
+        return Trigger.objects.select_related("integration", "connection").get(
+            id=pk,
+            automation__workspace_id__in=list(get_workspace_roles(user)),
+        )
+    except (Trigger.DoesNotExist, ValidationError):
+        return None
+
+
+# Token-authenticated, so there is no session cookie for CSRF to protect
+@csrf_exempt
+async def test_trigger(request, pk):
+    """
+    POST /triggers/<pk>/test/
+
+    A polling test can page through a provider's API (up to ~100 calls for
+    Gmail). googleapiclient is blocking, so the test runs on a pool thread
+    of its own and the event loop keeps serving other requests meanwhile.
+    """
+    if request.method != "POST":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    user = await authenticate_async(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided or are invalid."},
+            status=401,
+        )
+
+    trigger = await get_visible_trigger(user, pk)
+    if trigger is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
 
-@api_view(['POST'])
-def test_trigger(request, pk):
-    trigger = Trigger.objects.get(id=pk)
     service = INTEGRATION_REGISTRY[trigger.integration.id](trigger.connection)
-    result = run_trigger_test(
+    result = await run_blocking(
+        run_trigger_test,
         service=service,
         trigger_key=trigger.trigger_key,
         trigger_instance=trigger,
         connection=trigger.connection,
     )
     trigger.last_tested_at = timezone.now()
-    trigger.save()
+    await trigger.asave(update_fields=["last_tested_at"])
     if not result.get("success"):
-        return Response(result, status=400)
+        return JsonResponse(result, status=400, encoder=JSONEncoder)
     # print("RESULT -----> ", result)
-    return Response(result)
\ No newline at end of file
+    return JsonResponse(result, encoder=JSONEncoder)
@@ -0,0 +1,128 @@
+from threading import Lock
+
+from asgiref.sync import sync_to_async
+from cachetools import TTLCache
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import User
+
+
+TOKEN_VERSION_CLAIM = "ver"
+
+# active_workspace_id is left out on purpose: the local tier is not cleared
+# on other workers, and a stale active workspace would send writes to the
+# previously active one. It loads from the row on first access instead.
+SNAPSHOT_FIELDS = ("id", "email", "is_active", "token_version")
+
+_local_snapshots = TTLCache(
+    maxsize=settings.USER_SNAPSHOT_LOCAL_SIZE,
+    ttl=settings.USER_SNAPSHOT_LOCAL_TTL,
+)
+_local_lock = Lock()
+
+
+def snapshot_cache_key(user_id) -> str:
+    return f"user_snapshot_{user_id}"
+
+
+def get_user_snapshot(user_id):
+    """
+    The fields authentication needs, from the in-process LRU, then the
+    shared cache, then the database. None if the user does not exist.
+    """
+    key = snapshot_cache_key(user_id)
+
+    with _local_lock:
+        snapshot = _local_snapshots.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).first()
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, settings.USER_SNAPSHOT_CACHE_TTL)
+
+    with _local_lock:
+        _local_snapshots[key] = snapshot
+    return snapshot
+
+
+def invalidate_user_snapshot(user_id):
+    # Other processes drop their copy when USER_SNAPSHOT_LOCAL_TTL runs out
+    key = snapshot_cache_key(user_id)
+    cache.delete(key)
+    with _local_lock:
+        _local_snapshots.pop(key, None)
+
+
+def user_from_snapshot(snapshot) -> User:
+    # A deferred instance: fields outside the snapshot load on first access.
+    # Save it with update_fields only, or the cached values overwrite the row.
+    # from_db expects values in concrete field order.
+    field_names = [
+        field.attname for field in User._meta.concrete_fields if field.attname in SNAPSHOT_FIELDS
+    ]
+    return User.from_db("default", field_names, [snapshot[name] for name in field_names])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the user from a cached snapshot instead
+    of loading the User row on every request.
+
+    Tokens carry the user's token_version as the "ver" claim; bumping the
+    version (e.g. on password reset) rejects everything issued before.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise AuthenticationFailed("Token contained no recognizable user identification", code="token_not_valid")
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+        if not snapshot["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        # Tokens issued before versioning carry no claim and count as version 0
+        if validated_token.get(TOKEN_VERSION_CLAIM, 0) != snapshot["token_version"]:
+            raise AuthenticationFailed("Token has been revoked", code="token_not_valid")
+
+        return user_from_snapshot(snapshot)
+
+
+def get_raw_token(request, *, allow_query_token=False):
+    header = request.headers.get("Authorization", "")
+    if header.startswith("Bearer "):
+        return header.split(" ", 1)[1]
+    if allow_query_token:
+        return request.GET.get("token")
+    return None
+
+
+async def authenticate_async(request, *, allow_query_token=False):
+    """
+    The user behind a plain Django async view's Bearer token, or None.
+
+    DRF views are sync-only, so async views authenticate here. EventSource
+    cannot set headers, so streams may allow the token as `?token=`.
+    """
+    raw_token = get_raw_token(request, allow_query_token=allow_query_token)
+    if not raw_token:
+        return None
+
+    authentication = CachedJWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return await sync_to_async(authentication.get_user)(validated_token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
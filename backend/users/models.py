@@ -18,6 +18,8 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
     is_verified = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
     is_first_login = models.BooleanField(default=True)
+    # Stamped into issued JWTs as "ver"; bumping it revokes outstanding tokens
+    token_version = models.PositiveIntegerField(default=0)
     
     active_workspace = models.ForeignKey(
         "automations.Workspace",
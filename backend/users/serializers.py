@@ -135,5 +135,6 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     def save(self, **kwargs):
         user = self.validated_data["user"]
         user.set_password(self.validated_data["new_password"])
+        user.token_version += 1
         user.save()
         cache.delete(f"password_reset_{self.validated_data['token']}")
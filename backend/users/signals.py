@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.authentication import invalidate_user_snapshot
+from users.models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def clear_user_snapshot(sender, instance, **kwargs):
+    invalidate_user_snapshot(instance.pk)
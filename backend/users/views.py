@@ -17,6 +17,7 @@ from users.serializers import (PasswordResetConfirmSerializer,
 from api.utils import is_valid_email
 
 
+from .authentication import TOKEN_VERSION_CLAIM
 from .services import VerificationService
 
 
@@ -143,6 +144,7 @@ def login(request):
 
     if user is not None:
         refresh = RefreshToken.for_user(user)
+        refresh[TOKEN_VERSION_CLAIM] = user.token_version
         return Response(
             {
                 "refresh": str(refresh),
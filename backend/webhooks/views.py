@@ -19,8 +19,7 @@ def webhook_view(request, integration_key, trigger_key):
         mode="live",
         trigger_instance=None,
         connection=None, 
-        limit=None,
-        since_cursor=None
+        limit=None
     )
 
     process_events(events)
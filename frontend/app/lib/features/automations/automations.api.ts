@@ -7,7 +7,8 @@ export const getAutomations = async (params?: AutomationQueryParams) => {
     params,
   });
 
-  return res.data;
+  // Keyset-paginated: { next, previous, results }
+  return res.data.results;
 };
 
 export const getAutomation = async (id: string) => {